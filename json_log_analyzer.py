@@ -9,7 +9,7 @@ import json
 import re
 from datetime import datetime
 import os
-from log_analyzer import NimbleLogAnalyzer
+from log_analyzer import NimbleLogAnalyzer, iter_line_chunks, format_count_lines
 from nimble_app_log_parser import NimbleApplicationLogParser
 from syslog_parser import SyslogParser
 
@@ -42,8 +42,11 @@ except ImportError:
 class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
     """Extended log analyzer with JSON format support for Nimble Streamer."""
     
-    def __init__(self, log_file_path):
-        super().__init__(log_file_path)
+    # Syslog header (Jul 22 03:46:42 hostname ...) used for format detection
+    SYSLOG_LINE_PATTERN = re.compile(r'^\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\S+\s+')
+    
+    def __init__(self, log_file_path, keep_raw=False):
+        super().__init__(log_file_path, keep_raw=keep_raw)
         self.json_logs = []
         self.format_detected = None
         self.nimble_app_parser = NimbleApplicationLogParser()
@@ -125,17 +128,9 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
     
     def is_syslog_line(self, line):
         """Check if a line matches syslog format patterns."""
-        syslog_patterns = [
-            # Standard syslog format: Jul 22 03:46:42 hostname service[pid]: message
-            r'^\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\S+\s+\w+(?:\[\d+\])?\s*:\s*.*',
-            # Alternative syslog format
-            r'^\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\S+\s+.*',
-        ]
-        
-        for pattern in syslog_patterns:
-            if re.match(pattern, line):
-                return True
-        return False
+        # The service[pid]: form is a special case of the plain header, so one
+        # precompiled header match covers both
+        return self.SYSLOG_LINE_PATTERN.match(line) is not None
         
         print(f"🔍 Log format detection results:")
         print(f"   Sample lines analyzed: {sample_lines_analyzed}")
@@ -206,34 +201,24 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
         log_format = self.detect_log_format()
         
         logs = []
+        self.unparsed_lines = []
         total_lines = 0
         
+        # Count total lines for progress bar
+        print("🔢 Counting total lines...")
         with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as file:
-            chunk = []
-            
-            # Count total lines for progress bar
-            print("🔢 Counting total lines...")
             total_lines = sum(1 for _ in file)
-            file.seek(0)  # Reset to beginning
-            
-            with tqdm(total=total_lines, desc="Processing lines") as pbar:
-                for line_num, line in enumerate(file, 1):
-                    chunk.append(line.strip())
-                    
-                    if len(chunk) >= chunk_size:
-                        parsed_chunk = self.parse_log_chunk_enhanced(chunk, log_format)
-                        logs.extend(parsed_chunk)
-                        pbar.update(len(chunk))
-                        chunk = []
-                
-                # Process remaining lines
-                if chunk:
-                    parsed_chunk = self.parse_log_chunk_enhanced(chunk, log_format)
-                    logs.extend(parsed_chunk)
-                    pbar.update(len(chunk))
+        
+        with tqdm(total=total_lines, desc="Processing lines") as pbar:
+            # Chunks are read ahead on a background thread while this one parses
+            for chunk in iter_line_chunks(self.log_file_path, chunk_size):
+                parsed_chunk = self.parse_log_chunk_enhanced(chunk, log_format)
+                logs.extend(parsed_chunk)
+                pbar.update(len(chunk))
         
         self.parsed_logs = logs
         self.data = pd.DataFrame(logs)
+        self._prepare_time_columns()
         
         # Post-processing for JSON logs
         if log_format == 'json':
@@ -258,6 +243,8 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
             list: List of parsed log dictionaries
         """
         parsed_chunk = []
+        # One fallback timestamp per chunk instead of a clock call per line
+        now = datetime.now()
         
         for line in chunk:
             if not line.strip():
@@ -266,50 +253,55 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
             log_entry = None
             
             if log_format == 'json':
-                log_entry = self.parse_json_log_line(line)
+                log_entry = self.parse_json_log_line(line, now)
             elif log_format == 'syslog':
-                log_entry = self.parse_syslog_line(line)
+                log_entry = self.parse_syslog_line(line, now)
             elif log_format == 'nimble_app':
-                log_entry = self.parse_nimble_app_line(line)
+                log_entry = self.parse_nimble_app_line(line, now)
             elif log_format == 'traditional':
-                log_entry = self.parse_log_line(line)  # Use parent class method
+                log_entry = self.parse_log_line(line, now)  # Use parent class method
             else:  # unknown format - try everything
                 # Try JSON first
-                log_entry = self.parse_json_log_line(line)
+                log_entry = self.parse_json_log_line(line, now)
                 
                 # If JSON parsing failed, try syslog
                 if not log_entry or not log_entry.get('parsed', False):
-                    log_entry = self.parse_syslog_line(line)
+                    log_entry = self.parse_syslog_line(line, now)
                 
                 # If syslog parsing failed, try Nimble app format
                 if not log_entry or not log_entry.get('parsed', False):
-                    log_entry = self.parse_nimble_app_line(line)
+                    log_entry = self.parse_nimble_app_line(line, now)
                 
                 # If Nimble app parsing failed, try traditional
                 if not log_entry or not log_entry.get('parsed', False):
-                    log_entry = self.parse_log_line(line)
+                    log_entry = self.parse_log_line(line, now)
                 
                 # If traditional parsing also failed, create a basic entry
                 if not log_entry or not log_entry.get('parsed', False):
-                    log_entry = self.parse_unknown_format_line(line)
+                    log_entry = self.parse_unknown_format_line(line, now)
             
             if log_entry:
+                self.attach_raw_line(log_entry, line)
                 parsed_chunk.append(log_entry)
         
         return parsed_chunk
     
-    def parse_nimble_app_line(self, line):
+    def parse_nimble_app_line(self, line, now=None):
         """
         Parse a Nimble Streamer application log line.
         
         Args:
             line (str): Nimble app log line
+            now (datetime): Fallback timestamp (defaults to current time)
             
         Returns:
             dict: Parsed log entry
         """
+        if now is None:
+            now = datetime.now()
+        
         try:
-            result = self.nimble_app_parser.parse_line(line)
+            result = self.nimble_app_parser.parse_line(line, now)
             if result and result.get('parsed'):
                 # Add additional fields for compatibility with web interface
                 result['ip_address'] = None  # App logs don't have IP addresses
@@ -321,33 +313,35 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
                 if 'level' in result:
                     result['status_code'] = level_mapping.get(result['level'], 200)
                 
-                # Add hour for time analysis
+                # Add date for time analysis (hour is derived for all rows after parsing)
                 if 'timestamp' in result:
-                    result['hour'] = result['timestamp'].hour
                     result['date'] = result['timestamp'].date()
             
             return result
         except Exception as e:
             return {
-                'timestamp': datetime.now(),
-                'raw_line': line,
+                'timestamp': now,
                 'error': str(e),
                 'parsed': False,
                 'format': 'nimble_app_error'
             }
     
-    def parse_syslog_line(self, line):
+    def parse_syslog_line(self, line, now=None):
         """
         Parse a syslog format line using the SyslogParser.
         
         Args:
             line (str): Syslog line to parse
+            now (datetime): Fallback timestamp and source of the assumed year (defaults to current time)
             
         Returns:
             dict: Parsed syslog entry
         """
+        if now is None:
+            now = datetime.now()
+        
         try:
-            result = self.syslog_parser._parse_syslog_line(line, 0)
+            result = self.syslog_parser._parse_syslog_line(line, 0, now)
             if result:
                 # Add compatibility fields for web interface
                 result['status_code'] = None  # Syslog doesn't have HTTP status codes
@@ -369,9 +363,8 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
                 }
                 result['status_code'] = event_mapping.get(result.get('event_type', 'general'), 200)
                 
-                # Add hour and date for time analysis
+                # Add date for time analysis (hour is derived for all rows after parsing)
                 if result.get('datetime'):
-                    result['hour'] = result['datetime'].hour
                     result['date'] = result['datetime'].date()
                 elif result.get('timestamp'):
                     # Try to parse timestamp string for syslog format
@@ -380,7 +373,7 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
                         # Handle different timestamp formats
                         parts = timestamp_str.split()
                         if len(parts) == 3:  # Format: "Jul 22 02:34:02"
-                            current_year = datetime.now().year
+                            current_year = now.year
                             dt = datetime.strptime(f"{current_year} {timestamp_str}", "%Y %b %d %H:%M:%S")
                         elif len(parts) == 4:  # Format: "2024 Jul 22 02:34:02" 
                             dt = datetime.strptime(timestamp_str, "%Y %b %d %H:%M:%S")
@@ -390,44 +383,43 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
                                 dt = datetime.fromisoformat(timestamp_str.replace('T', ' ').replace('Z', ''))
                             except:
                                 # Fallback to current time
-                                dt = datetime.now()
+                                dt = now
                         
                         result['datetime'] = dt
-                        result['hour'] = dt.hour
                         result['date'] = dt.date()
                     except Exception as e:
                         print(f"Timestamp parsing error for '{result.get('timestamp', '')}': {e}")
                         # Fallback: use current time
-                        current_time = datetime.now()
-                        result['datetime'] = current_time
-                        result['hour'] = current_time.hour
-                        result['date'] = current_time.date()
+                        result['datetime'] = now
+                        result['date'] = now.date()
                 
                 result['format'] = 'syslog'
                 
             return result
         except Exception as e:
             return {
-                'timestamp': datetime.now(),
-                'raw_line': line,
+                'timestamp': now,
                 'error': str(e),
                 'parsed': False,
                 'format': 'syslog_error'
             }
     
-    def parse_unknown_format_line(self, line):
+    def parse_unknown_format_line(self, line, now=None):
         """
         Parse lines from unknown format - extracts basic information.
         
         Args:
             line (str): Log line to parse
+            now (datetime): Fallback timestamp (defaults to current time)
             
         Returns:
             dict: Basic log entry with extracted information
         """
+        if now is None:
+            now = datetime.now()
+        
         try:
             log_entry = {
-                'raw_line': line,
                 'parsed': True,
                 'format': 'unknown'
             }
@@ -445,13 +437,13 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
                 if match:
                     try:
                         timestamp_str = match.group(1)
-                        log_entry['timestamp'] = self.parse_timestamp(timestamp_str)
+                        log_entry['timestamp'] = self.parse_timestamp(timestamp_str, now)
                         log_entry['timestamp_raw'] = timestamp_str
                         break
                     except:
                         continue
             else:
-                log_entry['timestamp'] = datetime.now()
+                log_entry['timestamp'] = now
             
             # Try to extract IP address
             ip_pattern = r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b'
@@ -503,29 +495,31 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
             
         except Exception as e:
             return {
-                'timestamp': datetime.now(),
-                'raw_line': line,
+                'timestamp': now,
                 'error': str(e),
                 'parsed': False,
                 'format': 'unknown_error'
             }
     
-    def parse_json_log_line(self, line):
+    def parse_json_log_line(self, line, now=None):
         """
         Parse a JSON-formatted log line from Nimble Streamer.
         
         Args:
             line (str): JSON log line
+            now (datetime): Fallback timestamp (defaults to current time)
             
         Returns:
             dict: Parsed log entry or None if parsing fails
         """
+        if now is None:
+            now = datetime.now()
+        
         try:
             json_data = json.loads(line)
             
             # Extract and normalize fields based on your JSON format
             log_entry = {
-                'raw_line': line,
                 'parsed': True,
                 'format': 'json'
             }
@@ -534,10 +528,10 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
             timestamp_fields = ['timestamp', 'time', 'datetime', 'date']
             for field in timestamp_fields:
                 if field in json_data:
-                    log_entry['timestamp'] = self.parse_timestamp(json_data[field])
+                    log_entry['timestamp'] = self.parse_timestamp(json_data[field], now)
                     break
             else:
-                log_entry['timestamp'] = datetime.now()
+                log_entry['timestamp'] = now
             
             # Map JSON fields to standard fields
             field_mapping = {
@@ -573,27 +567,26 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
         except json.JSONDecodeError as e:
             # Not a valid JSON line
             return {
-                'timestamp': datetime.now(),
-                'raw_line': line,
+                'timestamp': now,
                 'error': f'JSON decode error: {str(e)}',
                 'parsed': False,
                 'format': 'json_error'
             }
         except Exception as e:
             return {
-                'timestamp': datetime.now(),
-                'raw_line': line,
+                'timestamp': now,
                 'error': str(e),
                 'parsed': False,
                 'format': 'json_error'
             }
     
-    def parse_timestamp(self, timestamp_value):
+    def parse_timestamp(self, timestamp_value, now=None):
         """
         Parse various timestamp formats.
         
         Args:
             timestamp_value: Timestamp in various formats
+            now (datetime): Fallback when the value can't be parsed (defaults to current time)
             
         Returns:
             datetime: Parsed datetime object
@@ -619,7 +612,7 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
                     continue
         
         # If all else fails, return current time
-        return datetime.now()
+        return now or datetime.now()
     
     def process_json_specific_fields(self):
         """Process JSON-specific fields for enhanced analysis."""
@@ -627,22 +620,14 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
             return
         
         # Add derived fields for streaming analysis
+        # (timestamp, hour and day_of_week are already prepared by read_log_file)
         if 'timestamp' in self.data.columns:
-            # Use the datetime column if available, otherwise try to parse timestamp
-            if 'datetime' in self.data.columns and not self.data['datetime'].isna().all():
-                # Use the already parsed datetime column
-                datetime_col = pd.to_datetime(self.data['datetime'], errors='coerce')
-            else:
-                # Try to parse timestamp with multiple formats
-                datetime_col = pd.to_datetime(self.data['timestamp'], errors='coerce', infer_datetime_format=True)
-            
-            self.data['hour'] = datetime_col.dt.hour
-            self.data['date'] = datetime_col.dt.date
-            self.data['day_of_week'] = datetime_col.dt.day_name()
+            self.data['date'] = self.data['timestamp'].dt.date
         
         # Standardize status/event types
         if 'status' in self.data.columns:
             self.data['event_category'] = self.data['status'].apply(self.categorize_event)
+            self._invalidate_vc('event_category')
         
         # Add streaming-specific metrics
         if 'protocol' in self.data.columns:
@@ -686,37 +671,36 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
         
         # Session analysis
         if 'session_id' in self.data.columns:
-            unique_sessions = self.data['session_id'].nunique()
+            unique_sessions = len(self._vc_of('session_id'))
             avg_events_per_session = len(self.data) / unique_sessions if unique_sessions > 0 else 0
             print(f"🎯 Total unique sessions: {unique_sessions:,}")
             print(f"📊 Average events per session: {avg_events_per_session:.2f}")
         
         # Stream analysis
         if 'stream_name' in self.data.columns:
-            unique_streams = self.data['stream_name'].nunique()
-            popular_streams = self.data['stream_name'].value_counts().head(10)
+            stream_counts = self._vc_of('stream_name')
+            unique_streams = len(stream_counts)
+            popular_streams = stream_counts.head(10)
             print(f"\n🎬 Total unique streams: {unique_streams:,}")
             print("🔥 Most popular streams:")
-            for stream, count in popular_streams.items():
-                if pd.notna(stream):
-                    print(f"   {stream}: {count:,} events")
+            if len(popular_streams):
+                print(format_count_lines(popular_streams, suffix=' events', indent='   '))
         
         # Protocol analysis
         if 'protocol' in self.data.columns:
-            protocol_dist = self.data['protocol'].value_counts()
+            protocol_dist = self._vc_of('protocol')
             print(f"\n🌐 Protocol distribution:")
-            for protocol, count in protocol_dist.items():
-                if pd.notna(protocol):
-                    percentage = (count / len(self.data)) * 100
-                    print(f"   {protocol}: {count:,} ({percentage:.1f}%)")
+            if len(protocol_dist):
+                percentages = (protocol_dist / len(self.data) * 100).map('{:.1f}'.format).to_numpy()
+                print(format_count_lines(protocol_dist, suffix=' (' + percentages + '%)', indent='   '))
         
         # Event analysis
         if 'event_category' in self.data.columns:
-            event_dist = self.data['event_category'].value_counts()
+            event_dist = self._vc_of('event_category')
             print(f"\n📈 Event category distribution:")
-            for event, count in event_dist.items():
-                percentage = (count / len(self.data)) * 100
-                print(f"   {event}: {count:,} ({percentage:.1f}%)")
+            if len(event_dist):
+                percentages = (event_dist / len(self.data) * 100).map('{:.1f}'.format).to_numpy()
+                print(format_count_lines(event_dist, suffix=' (' + percentages + '%)', indent='   '))
         
         # Success rate analysis
         if 'status' in self.data.columns:
@@ -727,13 +711,13 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
         
         # Client analysis
         if 'client_ip' in self.data.columns:
-            unique_clients = self.data['client_ip'].nunique()
-            top_clients = self.data['client_ip'].value_counts().head(5)
+            client_counts = self._vc_of('client_ip')
+            unique_clients = len(client_counts)
+            top_clients = client_counts.head(5)
             print(f"\n👥 Unique client IPs: {unique_clients:,}")
             print("🔝 Top client IPs:")
-            for ip, count in top_clients.items():
-                if pd.notna(ip):
-                    print(f"   {ip}: {count:,} events")
+            if len(top_clients):
+                print(format_count_lines(top_clients, suffix=' events', indent='   '))
     
     def export_enhanced_reports(self):
         """Export enhanced reports with JSON-specific data."""
@@ -756,25 +740,25 @@ class JSONNimbleLogAnalyzer(NimbleLogAnalyzer):
         if 'session_id' in self.data.columns:
             summary_data.append({
                 'Metric': 'Total Sessions',
-                'Value': self.data['session_id'].nunique()
+                'Value': len(self._vc_of('session_id'))
             })
         
         if 'stream_name' in self.data.columns:
             summary_data.append({
                 'Metric': 'Total Streams',
-                'Value': self.data['stream_name'].nunique()
+                'Value': len(self._vc_of('stream_name'))
             })
         
         if 'client_ip' in self.data.columns:
             summary_data.append({
                 'Metric': 'Unique Clients',
-                'Value': self.data['client_ip'].nunique()
+                'Value': len(self._vc_of('client_ip'))
             })
         
         if 'protocol' in self.data.columns:
             summary_data.append({
                 'Metric': 'Protocols Used',
-                'Value': self.data['protocol'].nunique()
+                'Value': len(self._vc_of('protocol'))
             })
         
         if summary_data:
@@ -17,24 +17,130 @@ from datetime import datetime, timedelta
 import re
 import os
 import sys
+import queue
+import threading
+from itertools import islice
 from tqdm import tqdm
 import json
 from collections import defaultdict, Counter
 import warnings
 warnings.filterwarnings('ignore')
 
+
+def iter_line_chunks(file_path, chunk_size=10000, prefetch=4):
+    """
+    Yield chunks of stripped lines, reading ahead on a background thread.
+    
+    The reader thread keeps up to `prefetch` chunks queued so disk reads
+    overlap with parsing of the previous chunk. Chunks are yielded in file order.
+    
+    Args:
+        file_path (str): Path to the file to read
+        chunk_size (int): Number of lines per chunk
+        prefetch (int): Maximum number of chunks read ahead of the consumer
+        
+    Yields:
+        list: Stripped lines of the next chunk
+    """
+    chunks = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    done = object()
+    
+    def put(item):
+        # Give up once the consumer has stopped iterating
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def reader():
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+                while True:
+                    chunk = [line.strip() for line in islice(file, chunk_size)]
+                    if not chunk or not put(chunk):
+                        break
+        except Exception as e:
+            put(e)
+        finally:
+            put(done)
+    
+    thread = threading.Thread(target=reader, name='log-reader', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def format_count_lines(counts, labels=None, suffix='', sep=': ', indent='  '):
+    """
+    Format a counts Series as '<indent><label><sep><count><suffix>' report lines.
+    
+    The block is built with vectorized string operations and returned as a
+    single string, so reports print it in one call instead of looping.
+    
+    Args:
+        counts (pd.Series): Counts indexed by label
+        labels (pd.Index): Display labels (defaults to the index as text)
+        suffix (str or array): Text after each count, or one entry per row
+        sep (str): Separator between label and count
+        indent (str): Leading indentation
+        
+    Returns:
+        str: Newline-joined report lines ('' when counts is empty)
+    """
+    if labels is None:
+        labels = counts.index.astype(str)
+    counts_text = counts.map('{:,}'.format).to_numpy()
+    return '\n'.join(indent + labels + sep + counts_text + suffix)
+
+
 class NimbleLogAnalyzer:
-    def __init__(self, log_file_path):
+    # Common log patterns - adapt based on your log format.
+    # Compiled once at import instead of being looked up for every line.
+    LINE_PATTERNS = [
+        # Apache/Nginx style: IP - - [timestamp] "method url protocol" status size
+        re.compile(r'(\d+\.\d+\.\d+\.\d+)\s+-\s+-\s+\[([^\]]+)\]\s+"([^"]+)"\s+(\d+)\s+(\d+)'),
+        
+        # Custom format: timestamp level message
+        re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+(\w+)\s+(.*)'),
+        
+        # IIS style: date time ip method uri status
+        re.compile(r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+([^\s]+)\s+(\d+)'),
+    ]
+    
+    # Number of unparsed raw lines kept for debugging when keep_raw is off
+    MAX_UNPARSED_SAMPLES = 1000
+    
+    # Small non-negative integer columns counted with np.bincount instead of hashing
+    BINCOUNT_COLUMNS = {'hour': 24, 'status_code': 600}
+    
+    def __init__(self, log_file_path, keep_raw=False):
         """
         Initialize the log analyzer with the path to the log file.
         
         Args:
             log_file_path (str): Path to the log file to analyze
+            keep_raw (bool): Keep the original line as 'raw_line' on every entry
         """
         self.log_file_path = log_file_path
+        self.keep_raw = keep_raw
         self.data = None
         self.parsed_logs = []
+        self.unparsed_lines = []
         self.reports = {}
+        self._vc = {}
+        self._vc_source = None
         
     def read_log_file(self, chunk_size=10000):
         """
@@ -52,26 +158,100 @@ class NimbleLogAnalyzer:
         print(f"File size: {file_size / (1024*1024):.2f} MB")
         
         logs = []
-        with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as file:
-            chunk = []
-            for line_num, line in enumerate(file, 1):
-                chunk.append(line.strip())
-                
-                if len(chunk) >= chunk_size:
-                    logs.extend(self.parse_log_chunk(chunk))
-                    chunk = []
-                    
-                    # Show progress for large files
-                    if line_num % (chunk_size * 10) == 0:
-                        print(f"Processed {line_num:,} lines...")
+        self.unparsed_lines = []
+        line_num = 0
+        # Lines are read ahead on a background thread while chunks are parsed here
+        for chunk in iter_line_chunks(self.log_file_path, chunk_size):
+            logs.extend(self.parse_log_chunk(chunk))
+            line_num += len(chunk)
             
-            # Process remaining lines
-            if chunk:
-                logs.extend(self.parse_log_chunk(chunk))
+            # Show progress for large files
+            if line_num % (chunk_size * 10) == 0:
+                print(f"Processed {line_num:,} lines...")
         
         self.parsed_logs = logs
         self.data = pd.DataFrame(logs)
+        self._prepare_time_columns()
         print(f"Successfully parsed {len(logs):,} log entries")
+    
+    def _prepare_time_columns(self):
+        """
+        Convert timestamps to datetime64 once and derive hour/day_of_week.
+        
+        Runs right after parsing so the report methods can use these columns
+        directly instead of re-converting the timestamp column every time.
+        """
+        if self.data is None or self.data.empty or 'timestamp' not in self.data.columns:
+            return
+        
+        timestamps = pd.to_datetime(self.data['timestamp'], errors='coerce')
+        if 'datetime' in self.data.columns:
+            # Syslog entries keep the text timestamp; the parsed value lives in 'datetime'
+            timestamps = pd.to_datetime(self.data['datetime'], errors='coerce').fillna(timestamps)
+        
+        self.data['timestamp'] = timestamps
+        # Nullable Int8 keeps hours compact while allowing NaT timestamps
+        self.data['hour'] = timestamps.dt.hour.astype('Int8')
+        self.data['day_of_week'] = timestamps.dt.day_name().astype('category')
+        self._invalidate_vc('timestamp', 'hour', 'day_of_week')
+    
+    def _vc_of(self, column):
+        """
+        Get value_counts() for a column of self.data, computed once and reused.
+        
+        Summary, time analysis, visualizations and exports all need the same
+        counts, so each column is scanned only once. The cache resets when
+        self.data is replaced; use _invalidate_vc() after rewriting a column.
+        
+        Args:
+            column (str): Column name
+            
+        Returns:
+            pd.Series: Counts per value, most frequent first
+        """
+        if self._vc_source is not self.data:
+            self._vc = {}
+            self._vc_source = self.data
+        
+        counts = self._vc.get(column)
+        if counts is None:
+            if column in self.BINCOUNT_COLUMNS:
+                counts = self._bincount_of(column, self.BINCOUNT_COLUMNS[column])
+            if counts is None:
+                counts = self.data[column].value_counts()
+            self._vc[column] = counts
+        return counts
+    
+    def _bincount_of(self, column, minlength):
+        """
+        Count a small integer column with a single np.bincount pass.
+        
+        Args:
+            column (str): Column name
+            minlength (int): Expected value range (e.g. 24 for hours)
+            
+        Returns:
+            pd.Series: Counts like value_counts(), or None when the column
+            holds anything other than small non-negative integers
+        """
+        raw = self.data[column]
+        values = pd.to_numeric(raw, errors='coerce')
+        if values.isna().sum() != raw.isna().sum():
+            return None  # non-numeric labels, keep value_counts()
+        
+        values = values.dropna()
+        if values.empty or values.min() < 0 or values.max() > 100 * minlength or (values % 1).any():
+            return None
+        
+        counts = np.bincount(values.to_numpy(dtype=np.int64), minlength=minlength)
+        present = np.flatnonzero(counts)
+        result = pd.Series(counts[present], index=pd.Index(present, name=column), name='count')
+        return result.sort_values(ascending=False, kind='stable')
+    
+    def _invalidate_vc(self, *columns):
+        """Drop cached value counts for columns that were rewritten."""
+        for column in columns:
+            self._vc.pop(column, None)
         
     def parse_log_chunk(self, chunk):
         """
@@ -84,67 +264,77 @@ class NimbleLogAnalyzer:
             list: List of parsed log dictionaries
         """
         parsed_chunk = []
+        # One fallback timestamp per chunk instead of a clock call per line
+        now = datetime.now()
         
         for line in chunk:
             if not line.strip():
                 continue
                 
-            log_entry = self.parse_log_line(line)
+            log_entry = self.parse_log_line(line, now)
             if log_entry:
+                self.attach_raw_line(log_entry, line)
                 parsed_chunk.append(log_entry)
         
         return parsed_chunk
     
-    def parse_log_line(self, line):
+    def attach_raw_line(self, log_entry, line):
+        """
+        Keep the original line for an entry according to keep_raw.
+        
+        With keep_raw the line is stored on the entry as 'raw_line'; otherwise
+        only unparsed lines are sampled into self.unparsed_lines for debugging.
+        
+        Args:
+            log_entry (dict): Parsed log entry
+            line (str): Original log line
+        """
+        if self.keep_raw:
+            log_entry['raw_line'] = line
+        elif not log_entry.get('parsed') and len(self.unparsed_lines) < self.MAX_UNPARSED_SAMPLES:
+            self.unparsed_lines.append(line)
+    
+    def parse_log_line(self, line, now=None):
         """
         Parse a single log line. Adapt this method based on your log format.
         
         Args:
             line (str): Single log line
+            now (datetime): Fallback timestamp for lines without one (defaults to current time)
             
         Returns:
             dict: Parsed log entry or None if parsing fails
         """
+        if now is None:
+            now = datetime.now()
+        
         try:
-            # Common log patterns - adapt based on your log format
-            patterns = [
-                # Apache/Nginx style: IP - - [timestamp] "method url protocol" status size
-                r'(\d+\.\d+\.\d+\.\d+)\s+-\s+-\s+\[([^\]]+)\]\s+"([^"]+)"\s+(\d+)\s+(\d+)',
-                
-                # Custom format: timestamp level message
-                r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+(\w+)\s+(.*)',
-                
-                # IIS style: date time ip method uri status
-                r'(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})\s+(\d+\.\d+\.\d+\.\d+)\s+(\w+)\s+([^\s]+)\s+(\d+)',
-            ]
-            
-            for pattern in patterns:
-                match = re.match(pattern, line)
+            for pattern in self.LINE_PATTERNS:
+                match = pattern.match(line)
                 if match:
-                    return self.extract_log_data(match, line)
+                    return self.extract_log_data(match, line, now)
             
             # If no pattern matches, create basic entry
             return {
-                'timestamp': datetime.now(),
-                'raw_line': line,
+                'timestamp': now,
                 'parsed': False
             }
             
         except Exception as e:
             return {
-                'timestamp': datetime.now(),
-                'raw_line': line,
+                'timestamp': now,
                 'error': str(e),
                 'parsed': False
             }
     
-    def extract_log_data(self, match, line):
+    def extract_log_data(self, match, line, now=None):
         """
         Extract structured data from regex match.
         
         Args:
             match: Regex match object
             line: Original log line
+            now: Fallback timestamp when none can be parsed (defaults to current time)
             
         Returns:
             dict: Structured log data
@@ -153,7 +343,6 @@ class NimbleLogAnalyzer:
         
         # Basic structure - adapt based on your log format
         log_data = {
-            'raw_line': line,
             'parsed': True
         }
         
@@ -174,10 +363,10 @@ class NimbleLogAnalyzer:
                 except ValueError:
                     continue
             else:
-                log_data['timestamp'] = datetime.now()
+                log_data['timestamp'] = now or datetime.now()
                 
         except:
-            log_data['timestamp'] = datetime.now()
+            log_data['timestamp'] = now or datetime.now()
         
         # Add other fields based on available groups
         if len(groups) > 1:
@@ -190,8 +379,14 @@ class NimbleLogAnalyzer:
     
     def is_ip_address(self, text):
         """Check if text is a valid IP address."""
-        ip_pattern = r'^\d+\.\d+\.\d+\.\d+$'
-        return bool(re.match(ip_pattern, text))
+        # Same shape as ^\d+\.\d+\.\d+\.\d+$ using only C-level str methods:
+        # three dots, no empty octet, decimal digits everywhere else; like $,
+        # one trailing newline is allowed
+        if text.endswith('\n'):
+            text = text[:-1]
+        return (text.count('.') == 3
+                and '..' not in f'.{text}.'
+                and text.replace('.', '', 3).isdecimal())
     
     def generate_summary_report(self):
         """Generate a comprehensive summary report."""
@@ -213,27 +408,29 @@ class NimbleLogAnalyzer:
         
         # Time range analysis
         if 'timestamp' in self.data.columns:
-            timestamps = pd.to_datetime(self.data['timestamp'])
+            timestamps = self.data['timestamp']
             print(f"Log time range: {timestamps.min()} to {timestamps.max()}")
             print(f"Log duration: {timestamps.max() - timestamps.min()}")
         
         # IP address analysis
         if 'ip_address' in self.data.columns:
-            unique_ips = self.data['ip_address'].nunique()
-            top_ips = self.data['ip_address'].value_counts().head(10)
+            ip_counts = self._vc_of('ip_address')
+            unique_ips = len(ip_counts)
+            top_ips = ip_counts.head(10)
             print(f"\nUnique IP addresses: {unique_ips:,}")
             print("\nTop 10 IP addresses:")
-            for ip, count in top_ips.items():
-                if ip:
-                    print(f"  {ip}: {count:,} requests")
+            top_ips = top_ips[top_ips.index.astype(bool)]
+            if len(top_ips):
+                print(format_count_lines(top_ips, suffix=' requests'))
         
         # Status code analysis
         if 'status_code' in self.data.columns:
-            status_counts = self.data['status_code'].value_counts()
+            status_counts = self._vc_of('status_code')
             print(f"\nStatus code distribution:")
-            for status, count in status_counts.items():
-                if status:
-                    print(f"  {status}: {count:,} ({(count/total_entries)*100:.2f}%)")
+            status_counts = status_counts[status_counts.index.astype(bool)]
+            if len(status_counts):
+                percentages = (status_counts / total_entries * 100).map('{:.2f}'.format).to_numpy()
+                print(format_count_lines(status_counts, suffix=' (' + percentages + '%)'))
         
         self.reports['summary'] = {
             'total_entries': total_entries,
@@ -252,22 +449,23 @@ class NimbleLogAnalyzer:
         print("TIME-BASED ANALYSIS")
         print("="*50)
         
-        # Convert to datetime if not already
-        self.data['timestamp'] = pd.to_datetime(self.data['timestamp'])
-        self.data['hour'] = self.data['timestamp'].dt.hour
-        self.data['day_of_week'] = self.data['timestamp'].dt.day_name()
+        # hour/day_of_week are derived once after parsing; only fill them in
+        # when data was assigned without going through read_log_file
+        if 'hour' not in self.data.columns or 'day_of_week' not in self.data.columns:
+            self._prepare_time_columns()
         
         # Hourly distribution
-        hourly_counts = self.data['hour'].value_counts().sort_index()
+        hourly_counts = self._vc_of('hour').sort_index()
         print("\nHourly request distribution:")
-        for hour, count in hourly_counts.items():
-            print(f"  {hour:02d}:00 - {count:,} requests")
+        if len(hourly_counts):
+            print(format_count_lines(hourly_counts, labels=hourly_counts.index.map('{:02d}:00'.format),
+                                     sep=' - ', suffix=' requests'))
         
         # Daily distribution
-        daily_counts = self.data['day_of_week'].value_counts()
+        daily_counts = self._vc_of('day_of_week')
         print(f"\nDaily request distribution:")
-        for day, count in daily_counts.items():
-            print(f"  {day}: {count:,} requests")
+        if len(daily_counts):
+            print(format_count_lines(daily_counts, suffix=' requests'))
     
     def create_visualizations(self, output_dir="reports"):
         """Create visualizations and save them to files."""
@@ -283,7 +481,7 @@ class NimbleLogAnalyzer:
         # 1. Hourly request distribution
         if 'hour' in self.data.columns:
             plt.figure(figsize=(12, 6))
-            hourly_counts = self.data['hour'].value_counts().sort_index()
+            hourly_counts = self._vc_of('hour').sort_index()
             plt.bar(hourly_counts.index, hourly_counts.values)
             plt.title('Request Distribution by Hour')
             plt.xlabel('Hour of Day')
@@ -297,7 +495,7 @@ class NimbleLogAnalyzer:
         # 2. Status code distribution
         if 'status_code' in self.data.columns:
             plt.figure(figsize=(10, 6))
-            status_counts = self.data['status_code'].value_counts()
+            status_counts = self._vc_of('status_code')
             plt.pie(status_counts.values, labels=status_counts.index, autopct='%1.1f%%')
             plt.title('Status Code Distribution')
             plt.axis('equal')
@@ -306,9 +504,12 @@ class NimbleLogAnalyzer:
             plt.close()
         
         # 3. Timeline plot
-        if 'timestamp' in self.data.columns:
+        if 'timestamp' in self.data.columns and self.data['timestamp'].notna().any():
             plt.figure(figsize=(14, 6))
-            daily_requests = self.data.groupby(self.data['timestamp'].dt.date).size()
+            # Daily bins on the datetime64 column directly (no Python date objects);
+            # days without entries are dropped to plot only observed dates as before
+            daily_requests = self.data.resample('D', on='timestamp').size()
+            daily_requests = daily_requests[daily_requests > 0]
             plt.plot(daily_requests.index, daily_requests.values, marker='o')
             plt.title('Daily Request Volume Over Time')
             plt.xlabel('Date')
@@ -342,15 +543,15 @@ class NimbleLogAnalyzer:
             
             # Summary statistics
             if 'ip_address' in self.data.columns:
-                ip_summary = self.data['ip_address'].value_counts().head(50)
+                ip_summary = self._vc_of('ip_address').head(50)
                 ip_summary.to_excel(writer, sheet_name='Top IPs')
             
             if 'status_code' in self.data.columns:
-                status_summary = self.data['status_code'].value_counts()
+                status_summary = self._vc_of('status_code')
                 status_summary.to_excel(writer, sheet_name='Status Codes')
             
             if 'hour' in self.data.columns:
-                hourly_summary = self.data['hour'].value_counts().sort_index()
+                hourly_summary = self._vc_of('hour').sort_index()
                 hourly_summary.to_excel(writer, sheet_name='Hourly Distribution')
         
         print(f"Reports exported:")
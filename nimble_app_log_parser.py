@@ -10,27 +10,28 @@ import pandas as pd
 class NimbleApplicationLogParser:
     """Parser specifically for Nimble Streamer application logs."""
     
-    def __init__(self):
+    def __init__(self, keep_raw=False):
+        """
+        Args:
+            keep_raw (bool): Keep the original line as 'raw_line' on parsed entries
+        """
+        self.keep_raw = keep_raw
         self.patterns = self.create_patterns()
     
     def create_patterns(self):
-        """Create regex patterns for different Nimble log types."""
-        return {
-            # Main pattern: [timestamp PID-TID] [component] Level: message
-            'main': r'^\[(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+([^\]]+)\]\s+\[([^\]]+)\]\s+([A-Z]):\s*(.*)',
-            
-            # Alternative pattern without component
-            'simple': r'^\[(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+([^\]]+)\]\s+([A-Z]):\s*(.*)',
+        """Create compiled regex patterns for different Nimble log types."""
+        patterns = {
+            # [timestamp PID-TID] [component] Level: message, the component being optional
+            'line': r'^\[(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+([^\]]+)\]\s+(?:\[([^\]]+)\]\s+)?([A-Z]):\s*(.*)',
             
             # HTTP error patterns
             'http_error': r'http\s+error\s+code=(\d+)\s+for\s+url=\'([^\']+)\'',
             
-            # URL parsing patterns - enhanced for better stream detection
-            'stream_url': r'https?://[^/]+/stream/([^/]+)/[^?]*(?:\?.*)?',
-            'stream_url_with_ip': r'https?://([^:/]+)(?::\d+)?/stream/([^/]+)/[^?]*(?:\?.*)?',
-            
-            # IP address extraction from URLs
-            'url_ip': r'https?://([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)(?::\d+)?',
+            # Whole URL with its parts in one pass: leading dotted-quad IP,
+            # host[:port] and the /stream/<name>/ segment
+            'url_parts': (r'https?://(?=[^\s\'"])'
+                          r'(?P<host>(?P<ip>[0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)?[^\s\'"/]*)'
+                          r'(?:/stream/(?P<stream>[^/\s\'"]+)/)?[^\s\'"]*'),
             
             # Connection/streaming specific patterns
             'connection': r'.*(?:connect|disconnect|play|publish|stream).*',
@@ -38,13 +39,16 @@ class NimbleApplicationLogParser:
             'warning': r'.*(?:warn|warning).*',
             'info': r'.*(?:info|started|stopped|listening).*',
         }
+        # Compile once; these run for every line of large log files
+        return {name: re.compile(pattern) for name, pattern in patterns.items()}
     
-    def parse_line(self, line):
+    def parse_line(self, line, now=None):
         """
         Parse a single Nimble Streamer application log line.
         
         Args:
             line (str): Log line to parse
+            now (datetime): Fallback timestamp (defaults to current time)
             
         Returns:
             dict: Parsed log entry
@@ -53,8 +57,8 @@ class NimbleApplicationLogParser:
         if not line:
             return None
             
-        # Try main pattern first
-        match = re.match(self.patterns['main'], line)
+        # Lines with and without a component in a single match
+        match = self.patterns['line'].match(line)
         if match:
             timestamp_str, process_info, component, level, message = match.groups()
             
@@ -63,51 +67,20 @@ class NimbleApplicationLogParser:
             url_details = self.extract_url_details(message)
             
             base_entry = {
-                'timestamp': self.parse_timestamp(timestamp_str),
+                'timestamp': self.parse_timestamp(timestamp_str, now),
                 'timestamp_raw': timestamp_str,
                 'process_info': process_info,
-                'component': component,
+                'component': component if component is not None else 'unknown',
                 'level': level,
                 'message': message,
-                'raw_line': line,
                 'parsed': True,
                 'format': 'nimble_app_log',
                 'log_type': self.categorize_message(message, level),
                 'severity': self.get_severity_level(level)
             }
             
-            # Add HTTP error details if found
-            if error_details:
-                base_entry.update(error_details)
-                
-            # Add URL details if found  
-            if url_details:
-                base_entry.update(url_details)
-                
-            return base_entry
-        
-        # Try simple pattern
-        match = re.match(self.patterns['simple'], line)
-        if match:
-            timestamp_str, process_info, level, message = match.groups()
-            
-            # Parse additional details from message
-            error_details = self.extract_http_error_details(message)
-            url_details = self.extract_url_details(message)
-            
-            base_entry = {
-                'timestamp': self.parse_timestamp(timestamp_str),
-                'timestamp_raw': timestamp_str,
-                'process_info': process_info,
-                'component': 'unknown',
-                'level': level,
-                'message': message,
-                'raw_line': line,
-                'parsed': True,
-                'format': 'nimble_app_log',
-                'log_type': self.categorize_message(message, level),
-                'severity': self.get_severity_level(level)
-            }
+            if self.keep_raw:
+                base_entry['raw_line'] = line
             
             # Add HTTP error details if found
             if error_details:
@@ -120,20 +93,22 @@ class NimbleApplicationLogParser:
             return base_entry
         
         # If no pattern matches, create basic entry
-        return {
-            'timestamp': datetime.now(),
-            'raw_line': line,
+        entry = {
+            'timestamp': now or datetime.now(),
             'parsed': False,
             'format': 'nimble_app_log',
             'error': 'No pattern matched'
         }
+        if self.keep_raw:
+            entry['raw_line'] = line
+        return entry
     
-    def parse_timestamp(self, timestamp_str):
-        """Parse Nimble timestamp format."""
+    def parse_timestamp(self, timestamp_str, now=None):
+        """Parse Nimble timestamp format, falling back to `now` (or the current time)."""
         try:
             return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
         except ValueError:
-            return datetime.now()
+            return now or datetime.now()
     
     def extract_http_error_details(self, message):
         """
@@ -145,7 +120,7 @@ class NimbleApplicationLogParser:
         Returns:
             dict: Dictionary with error details or None
         """
-        match = re.search(self.patterns['http_error'], message)
+        match = self.patterns['http_error'].search(message)
         if match:
             error_code = int(match.group(1))
             full_url = match.group(2)
@@ -169,40 +144,36 @@ class NimbleApplicationLogParser:
         Returns:
             dict: Dictionary with IP and stream details or None
         """
-        # Look for URLs in the message
-        url_match = re.search(r'https?://[^\s\'\"]+', message)
-        if not url_match:
+        # Cheap substring check before running any regex
+        if 'http' not in message:
+            return None
+        
+        # Single search extracts the URL, a leading server IP and the stream name
+        match = self.patterns['url_parts'].search(message)
+        if not match:
             return None
             
-        url = url_match.group(0)
+        url, host, server_ip, stream_name = match.group(0, 'host', 'ip', 'stream')
         result = {'has_url': True, 'full_url': url}
         
-        # Extract IP address from URL
-        ip_match = re.search(self.patterns['url_ip'], url)
-        if ip_match:
-            server_ip = ip_match.group(1)
+        # IP address from URL
+        if server_ip:
             result['server_ip'] = server_ip
             result['has_server_ip'] = True
         
-        # Extract stream details from URL pattern with IP
-        stream_ip_match = re.search(self.patterns['stream_url_with_ip'], url)
-        if stream_ip_match:
-            server_ip = stream_ip_match.group(1)
-            stream_name = stream_ip_match.group(2)
-            
-            result.update({
-                'has_stream_info': True,
-                'server_ip': server_ip,
-                'stream_name': stream_name,
-                'has_server_ip': True
-            })
-            return result
-        
-        # Fallback: Extract stream name only (without IP)
-        stream_match = re.search(self.patterns['stream_url'], url)
-        if stream_match:
-            stream_name = stream_match.group(1)
+        if stream_name and host:
+            # host[:port] in front of /stream/ is reported as the server
+            hostname, has_port, port = host.partition(':')
+            if hostname and (not has_port or port.isdigit()):
+                result.update({
+                    'has_stream_info': True,
+                    'server_ip': hostname,
+                    'stream_name': stream_name,
+                    'has_server_ip': True
+                })
+                return result
             
+            # Fallback: stream name only (without IP)
             result.update({
                 'has_stream_info': True,
                 'stream_name': stream_name
@@ -263,12 +234,25 @@ class NimbleApplicationLogParser:
         }
         return severity_map.get(level, 0)
     
-    def analyze_logs(self, log_data):
-        """Analyze parsed log data for insights."""
-        if not log_data:
+    def analyze_logs(self, df):
+        """
+        Analyze parsed log data for insights.
+        
+        Args:
+            df (pd.DataFrame): Parsed entries, e.g. the analyzer's `data` frame
+                (used as-is, no copy is made)
+            
+        Returns:
+            dict: Analysis results
+        """
+        if df is None or df.empty:
             return {}
         
-        df = pd.DataFrame(log_data)
+        def flag(column):
+            # Boolean mask for an optional has_* column
+            if column not in df.columns:
+                return pd.Series(False, index=df.index)
+            return df[column] == True
         
         # Basic analysis
         analysis = {
@@ -286,7 +270,7 @@ class NimbleApplicationLogParser:
         }
         
         # HTTP Error Analysis
-        http_errors_df = df[df.get('has_http_error', False) == True]
+        http_errors_df = df[flag('has_http_error')]
         if not http_errors_df.empty:
             analysis['http_errors'] = {
                 'total_http_errors': len(http_errors_df),
@@ -296,7 +280,7 @@ class NimbleApplicationLogParser:
             }
         
         # Server IP Analysis (from URLs)
-        server_ips_df = df[df.get('has_server_ip', False) == True]
+        server_ips_df = df[flag('has_server_ip')]
         if not server_ips_df.empty:
             analysis['server_ips'] = {
                 'total_server_requests': len(server_ips_df),
@@ -306,7 +290,7 @@ class NimbleApplicationLogParser:
             }
         
         # Streaming Analysis
-        streaming_df = df[df.get('has_stream_info', False) == True]
+        streaming_df = df[flag('has_stream_info')]
         if not streaming_df.empty:
             analysis['streaming'] = {
                 'total_stream_events': len(streaming_df),
@@ -316,7 +300,7 @@ class NimbleApplicationLogParser:
             }
         
         # Error + Streaming Combined Analysis
-        error_streaming_df = df[(df.get('has_http_error', False) == True) & (df.get('has_stream_info', False) == True)]
+        error_streaming_df = df[flag('has_http_error') & flag('has_stream_info')]
         if not error_streaming_df.empty:
             analysis['error_streaming'] = {
                 'total_stream_errors': len(error_streaming_df),
@@ -328,14 +312,14 @@ class NimbleApplicationLogParser:
             }
         
         # Server + Stream Combinations  
-        server_stream_df = df[(df.get('has_server_ip', False) == True) & (df.get('has_stream_info', False) == True)]
+        server_stream_df = df[flag('has_server_ip') & flag('has_stream_info')]
         if not server_stream_df.empty:
-            # Create server:stream combinations
-            server_stream_df['server_stream'] = server_stream_df['server_ip'] + ':' + server_stream_df['stream_name']
+            # Create server:stream combinations (kept local so the caller's frame isn't modified)
+            server_stream = server_stream_df['server_ip'] + ':' + server_stream_df['stream_name']
             analysis['server_stream_combinations'] = {
                 'total_combinations': len(server_stream_df),
-                'unique_combinations': server_stream_df['server_stream'].nunique(),
-                'top_server_stream_pairs': server_stream_df['server_stream'].value_counts().head(15).to_dict()
+                'unique_combinations': server_stream.nunique(),
+                'top_server_stream_pairs': server_stream.value_counts().head(15).to_dict()
             }
         
         return analysis
@@ -351,19 +335,21 @@ def test_parser():
     
     parser = NimbleApplicationLogParser()
     
-    print("🧪 TESTING NIMBLE APPLICATION LOG PARSER")
-    print("=" * 60)
+    # Collect the report and write it with a single print
+    report = ["🧪 TESTING NIMBLE APPLICATION LOG PARSER", "=" * 60]
     
     for i, line in enumerate(test_lines, 1):
         result = parser.parse_line(line)
-        print(f"\nTest {i}: {line[:50]}...")
-        print(f"   Parsed: {'✅' if result.get('parsed') else '❌'}")
+        report.append(f"\nTest {i}: {line[:50]}...")
+        report.append(f"   Parsed: {'✅' if result.get('parsed') else '❌'}")
         if result.get('parsed'):
-            print(f"   Timestamp: {result.get('timestamp')}")
-            print(f"   Component: {result.get('component')}")
-            print(f"   Level: {result.get('level')}")
-            print(f"   Type: {result.get('log_type')}")
-            print(f"   Message: {result.get('message', '')[:50]}...")
+            report.append(f"   Timestamp: {result.get('timestamp')}")
+            report.append(f"   Component: {result.get('component')}")
+            report.append(f"   Level: {result.get('level')}")
+            report.append(f"   Type: {result.get('log_type')}")
+            report.append(f"   Message: {result.get('message', '')[:50]}...")
+    
+    print("\n".join(report))
 
 if __name__ == "__main__":
     test_parser()
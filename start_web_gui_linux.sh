@@ -58,15 +58,8 @@ echo ""
 python3 -c "
 import sys
 sys.path.insert(0, '.')
-from web_gui import app
+from web_gui import run_server
 
 # Configure for external access
-app.run(
-    host='0.0.0.0',  # Allow external connections
-    port=${PORT:-8050},
-    debug=False,
-    dev_tools_ui=False,
-    dev_tools_props_check=False,
-    use_reloader=False
-)
+run_server('0.0.0.0', ${PORT:-8050})  # Allow external connections
 "
@@ -7,7 +7,8 @@ import pandas as pd
 import re
 from datetime import datetime, timedelta
 import os
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
 class SyslogParser:
     """
@@ -18,19 +19,79 @@ class SyslogParser:
     Jul 22 03:47:01 s7 CRON[2527725]: pam_unix(cron:session): session opened
     """
     
-    def __init__(self):
+    # Fields of a parsed entry, in the order _parse_syslog_fields returns them
+    COLUMNS = ('line_number', 'timestamp', 'datetime', 'hostname', 'service', 'pid',
+               'message', 'ip_address', 'event_type', 'severity', 'parsed')
+    
+    # Syslog writes English month abbreviations regardless of locale
+    MONTHS = {
+        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+    }
+    
+    # Parsed timestamps kept before the cache is reset
+    TS_CACHE_SIZE = 100000
+    
+    # Classified messages kept before the cache is reset
+    MESSAGE_CACHE_SIZE = 10000
+    
+    # Low-cardinality text columns whose repeated values share one string object
+    POOLED_COLUMNS = ('hostname', 'service', 'message')
+    STRING_POOL_SIZE = 100000
+    
+    # Event keywords in priority order; the first one found in the message wins
+    EVENT_KEYWORDS = (
+        ('authentication failure', 'auth_failure'),
+        ('invalid login', 'auth_failure'),
+        ('login failed', 'auth_failure'),
+        ('blocked', 'security_block'),
+        ('banned', 'security_block'),
+        ('connection closed', 'connection_end'),
+        ('connection reset', 'connection_end'),
+        ('session opened', 'session_start'),
+        ('session closed', 'session_end'),
+        ('preauth', 'auth_attempt'),
+        ('error', 'error'),
+        ('failed', 'error'),
+        ('cron', 'scheduled_task'),
+    )
+    
+    # Severity keywords in priority order; messages matching none are 'info'
+    SEVERITY_KEYWORDS = (
+        ('blocked', 'critical'),
+        ('security alert', 'critical'),
+        ('banned', 'critical'),
+        ('authentication failure', 'warning'),
+        ('invalid login', 'warning'),
+        ('error', 'warning'),
+    )
+    
+    def __init__(self, keep_raw: bool = False):
+        """
+        Args:
+            keep_raw: Keep the original line as 'raw_line' on parsed entries
+        """
         self.format_detected = "syslog"
+        self.keep_raw = keep_raw
+        self._ts_cache = {}
+        self._message_cache = {}
+        self._string_pool = {}
         
-        # Common syslog patterns
+        # Common syslog patterns; header fields are ASCII, so the classes
+        # skip Unicode lookups (re.ASCII)
         self.syslog_pattern = re.compile(
             r'^(?P<month>\w+)\s+(?P<day>\d+)\s+(?P<time>\d+:\d+:\d+)\s+'
             r'(?P<hostname>\S+)\s+'
             r'(?P<service>\w+)(?:\[(?P<pid>\d+)\])?\:\s*'
-            r'(?P<message>.*)$'
+            r'(?P<message>.*)$',
+            re.ASCII
         )
         
         # IP address extraction pattern
-        self.ip_pattern = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+        self.ip_pattern = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', re.ASCII)
+        
+        # Dotted-quad shape shared by every IP pattern; lines without it skip them all
+        self.ip_candidate_pattern = re.compile(r'\d+\.\d+\.\d+\.\d+', re.ASCII)
         
         # Authentication patterns
         self.auth_patterns = {
@@ -42,6 +103,18 @@ class SyslogParser:
             'ssh_preauth': re.compile(r'from (\d+\.\d+\.\d+\.\d+) port \d+ \[preauth\]')
         }
         
+        # Literal each auth pattern cannot match without; a substring test
+        # decides whether the regex is worth running at all
+        auth_literals = {
+            'ssh_connection': 'Connection ',
+            'ssh_invalid': 'Invalid user ',
+            'pam_failure': 'authentication failure',
+            'webmin_invalid': 'Invalid login as ',
+            'blocked_host': ' blocked',
+            'ssh_preauth': ' [preauth]'
+        }
+        self._auth_scan = [(auth_literals[name], pattern) for name, pattern in self.auth_patterns.items()]
+        
     def parse_log_file(self, file_path: str, chunk_size: int = 10000) -> pd.DataFrame:
         """
         Parse syslog file and return structured DataFrame.
@@ -55,31 +128,27 @@ class SyslogParser:
         """
         print(f"🔍 Parsing syslog file: {file_path}")
         
-        parsed_entries = []
+        # Entries are collected column-wise and never materialized as per-line dicts
+        columns = {name: [] for name in self.COLUMNS}
+        if self.keep_raw:
+            columns['raw_line'] = []
         total_lines = 0
         parsed_count = 0
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                chunk = []
-                for line_num, line in enumerate(file, 1):
-                    total_lines += 1
-                    chunk.append(line.strip())
+            # A 1 MiB buffer cuts read calls on large logs
+            with open(file_path, 'r', encoding='utf-8', errors='ignore', buffering=1 << 20) as file:
+                while True:
+                    # Take a whole chunk off the file iterator at once
+                    chunk = [line.strip() for line in islice(file, chunk_size)]
+                    if not chunk:
+                        break
                     
-                    if len(chunk) >= chunk_size:
-                        chunk_results = self._parse_chunk(chunk, line_num - len(chunk) + 1)
-                        parsed_entries.extend(chunk_results)
-                        parsed_count += len(chunk_results)
-                        chunk = []
-                        
-                        if line_num % (chunk_size * 10) == 0:
-                            print(f"📊 Processed {line_num:,} lines, parsed {parsed_count:,} entries")
-                
-                # Process remaining lines
-                if chunk:
-                    chunk_results = self._parse_chunk(chunk, total_lines - len(chunk) + 1)
-                    parsed_entries.extend(chunk_results)
-                    parsed_count += len(chunk_results)
+                    parsed_count += self._parse_chunk(chunk, total_lines + 1, columns)
+                    total_lines += len(chunk)
+                    
+                    if total_lines % (chunk_size * 10) == 0:
+                        print(f"📊 Processed {total_lines:,} lines, parsed {parsed_count:,} entries")
         
         except Exception as e:
             print(f"❌ Error reading file: {e}")
@@ -87,11 +156,12 @@ class SyslogParser:
         
         print(f"✅ Parsing complete: {parsed_count:,} entries from {total_lines:,} lines")
         
-        if not parsed_entries:
+        if not parsed_count:
             print("⚠️ No valid syslog entries found")
             return pd.DataFrame()
             
-        df = pd.DataFrame(parsed_entries)
+        df = pd.DataFrame(columns)
+        self._classify_messages(df)
         
         # Add derived columns
         df['parsed'] = True
@@ -99,25 +169,66 @@ class SyslogParser:
         
         return df
     
-    def _parse_chunk(self, chunk: List[str], start_line: int) -> List[Dict]:
-        """Parse a chunk of log lines."""
-        parsed_entries = []
+    def _parse_chunk(self, chunk: List[str], start_line: int, columns: Dict[str, List]) -> int:
+        """Parse a chunk of log lines onto the column lists; returns the number of entries added."""
+        rows = []
+        raw_lines = []
+        # Capture the clock once per chunk; it supplies the assumed year
+        now = datetime.now()
         
-        for i, line in enumerate(chunk):
+        # Bind the per-line callables once; attribute lookups dominate a loop this tight
+        parse = self._parse_syslog_fields
+        add_row = rows.append
+        add_raw = raw_lines.append if self.keep_raw else None
+        
+        for line_num, line in enumerate(chunk, start_line):
             try:
-                entry = self._parse_syslog_line(line, start_line + i)
-                if entry:
-                    parsed_entries.append(entry)
+                fields = parse(line, line_num, now, False)
+                if fields:
+                    add_row(fields)
+                    if add_raw:
+                        add_raw(line)
             except Exception as e:
                 # Continue parsing even if individual lines fail
                 continue
+        
+        # Transpose the chunk's rows onto the columns in one go; pooled columns
+        # keep one copy of each repeated string instead of one per line
+        if len(self._string_pool) >= self.STRING_POOL_SIZE:
+            self._string_pool.clear()
+        pool = self._string_pool.setdefault
+        for name, values in zip(self.COLUMNS, zip(*rows)):
+            if name in self.POOLED_COLUMNS:
+                values = map(pool, values, values)
+            columns[name].extend(values)
+        if self.keep_raw:
+            columns['raw_line'].extend(raw_lines)
                 
-        return parsed_entries
+        return len(rows)
     
-    def _parse_syslog_line(self, line: str, line_num: int) -> Optional[Dict]:
-        """Parse a single syslog line."""
+    def _parse_syslog_line(self, line: str, line_num: int, now: Optional[datetime] = None) -> Optional[Dict]:
+        """Parse a single syslog line into an entry dict; `now` supplies the year syslog omits."""
+        fields = self._parse_syslog_fields(line, line_num, now)
+        if fields is None:
+            return None
+        
+        entry = dict(zip(self.COLUMNS, fields))
+        if self.keep_raw:
+            entry['raw_line'] = line
+        return entry
+    
+    def _parse_syslog_fields(self, line: str, line_num: int, now: Optional[datetime] = None,
+                             classify: bool = True) -> Optional[Tuple]:
+        """
+        Parse a single syslog line into a tuple of COLUMNS values.
+        
+        With classify=False the message-derived fields of matched lines are left
+        as None for _classify_messages to fill in per distinct message.
+        """
         if not line.strip():
             return None
+        if now is None:
+            now = datetime.now()
             
         # Try to match standard syslog format
         match = self.syslog_pattern.match(line)
@@ -128,122 +239,147 @@ class SyslogParser:
             if len(parts) < 5:
                 return None
             
-            return {
-                'line_number': line_num,
-                'raw_line': line,
-                'timestamp': f"{parts[0]} {parts[1]} {parts[2]}",
-                'hostname': parts[3] if len(parts) > 3 else '',
-                'service': 'unknown',
-                'pid': None,
-                'message': ' '.join(parts[4:]) if len(parts) > 4 else '',
-                'ip_address': self._extract_ip(line),
-                'event_type': self._classify_event(line),
-                'severity': self._determine_severity(line),
-                'parsed': True
-            }
+            event_type, severity = self._classify(line)
+            return (
+                line_num,
+                f"{parts[0]} {parts[1]} {parts[2]}",
+                None,
+                parts[3] if len(parts) > 3 else '',
+                'unknown',
+                None,
+                ' '.join(parts[4:]) if len(parts) > 4 else '',
+                self._extract_ip(line),
+                event_type,
+                severity,
+                True
+            )
         
-        # Extract data from regex match
-        groups = match.groupdict()
+        # Extract data from regex match (groups in syslog_pattern order)
+        month, day, time, hostname, service, pid, message = match.groups()
         
-        # Create timestamp (assume current year if not specified)
-        try:
-            current_year = datetime.now().year
-            timestamp_str = f"{current_year} {groups['month']} {groups['day']} {groups['time']}"
-            timestamp = datetime.strptime(timestamp_str, "%Y %b %d %H:%M:%S")
-        except Exception as e:
-            # If parsing fails, keep the original format and let the caller handle it
-            timestamp_str = f"{groups['month']} {groups['day']} {groups['time']}"
-            # Try parsing without year as fallback
+        # Many lines share a second, so each distinct timestamp is parsed once
+        key = (now.year, month, day, time)
+        cached = self._ts_cache.get(key)
+        if cached is None:
+            # Create timestamp (assume current year if not specified); the usual
+            # "Mon DD HH:MM:SS" shape is built directly, anything else via strptime
+            month_num = self.MONTHS.get(month.lower())
             try:
-                # Use current year
-                current_year = datetime.now().year
-                timestamp = datetime.strptime(f"{current_year} {timestamp_str}", "%Y %b %d %H:%M:%S")
-            except:
+                timestamp_str = f"{now.year} {month} {day} {time}"
+                if month_num and len(day) <= 2 and len(time) == 8 and time[2] == ':' and time[5] == ':':
+                    timestamp = datetime(now.year, month_num, int(day), int(time[:2]), int(time[3:5]), int(time[6:]))
+                else:
+                    timestamp = datetime.strptime(timestamp_str, "%Y %b %d %H:%M:%S")
+            except ValueError:
+                # If parsing fails, keep the original format and let the caller handle it
+                timestamp_str = f"{month} {day} {time}"
                 timestamp = None
+            
+            if len(self._ts_cache) >= self.TS_CACHE_SIZE:
+                self._ts_cache.clear()
+            cached = self._ts_cache[key] = (timestamp_str, timestamp)
+        timestamp_str, timestamp = cached
         
-        # Extract IP address from message
-        ip_address = self._extract_ip(groups['message'])
-        
-        # Classify event type
-        event_type = self._classify_event(groups['message'])
-        
-        # Determine severity
-        severity = self._determine_severity(groups['message'])
-        
-        return {
-            'line_number': line_num,
-            'raw_line': line,
-            'timestamp': timestamp_str,
-            'datetime': timestamp,
-            'hostname': groups['hostname'],
-            'service': groups['service'],
-            'pid': int(groups['pid']) if groups['pid'] else None,
-            'message': groups['message'],
-            'ip_address': ip_address,
-            'event_type': event_type,
-            'severity': severity,
-            'parsed': True
-        }
+        if classify:
+            # IP address, event type and severity from the message
+            ip_address, event_type, severity = self._message_fields(message)
+        else:
+            ip_address = event_type = severity = None
+        
+        return (
+            line_num,
+            timestamp_str,
+            timestamp,
+            hostname,
+            service,
+            int(pid) if pid else None,
+            message,
+            ip_address,
+            event_type,
+            severity,
+            True
+        )
+    
+    def _classify_messages(self, df: pd.DataFrame) -> None:
+        """Fill ip_address, event_type and severity for unclassified rows, once per distinct message."""
+        pending = df['event_type'].isna()
+        if not pending.any():
+            return
+        
+        # Syslog repeats a small set of messages, so classify the uniques and broadcast back
+        codes, messages = pd.factorize(df.loc[pending, 'message'])
+        fields = pd.DataFrame(
+            [self._message_fields(m) for m in messages],
+            columns=['ip_address', 'event_type', 'severity']
+        )
+        df.loc[pending, fields.columns] = fields.to_numpy()[codes]
+    
+    def _message_fields(self, message: str) -> Tuple[Optional[str], str, str]:
+        """(ip_address, event_type, severity) for a message, memoized since messages repeat."""
+        fields = self._message_cache.get(message)
+        if fields is None:
+            if len(self._message_cache) >= self.MESSAGE_CACHE_SIZE:
+                self._message_cache.clear()
+            fields = self._message_cache[message] = (self._extract_ip(message), *self._classify(message))
+        return fields
     
     def _extract_ip(self, text: str) -> Optional[str]:
         """Extract IP address from log message."""
-        # Try specific patterns first
-        for pattern_name, pattern in self.auth_patterns.items():
-            match = pattern.search(text)
-            if match:
-                return match.group(1)
+        # A dotted quad needs three dots; counting them is a C-level byte scan
+        # that rules out most messages before any regex runs
+        if text.count('.') < 3:
+            return None
+        
+        # One scan rules out the remaining messages with no IP at all
+        if not self.ip_candidate_pattern.search(text):
+            return None
+        
+        # Try specific patterns first, skipping those whose literal is absent
+        for literal, pattern in self._auth_scan:
+            if literal in text:
+                match = pattern.search(text)
+                if match:
+                    return match.group(1)
         
         # Fallback to general IP pattern
         match = self.ip_pattern.search(text)
         return match.group(0) if match else None
     
-    def _classify_event(self, message: str) -> str:
-        """Classify the type of event based on message content."""
+    def _classify(self, message: str) -> Tuple[str, str]:
+        """Classify event type and severity based on message content."""
         message_lower = message.lower()
         
-        # Authentication events
-        if any(keyword in message_lower for keyword in ['authentication failure', 'invalid login', 'login failed']):
-            return 'auth_failure'
-        elif any(keyword in message_lower for keyword in ['blocked', 'banned']):
-            return 'security_block'
-        elif any(keyword in message_lower for keyword in ['connection closed', 'connection reset']):
-            return 'connection_end'
-        elif any(keyword in message_lower for keyword in ['session opened']):
-            return 'session_start'
-        elif any(keyword in message_lower for keyword in ['session closed']):
-            return 'session_end'
-        elif any(keyword in message_lower for keyword in ['preauth']):
-            return 'auth_attempt'
-        elif any(keyword in message_lower for keyword in ['error', 'failed']):
-            return 'error'
-        elif any(keyword in message_lower for keyword in ['cron']):
-            return 'scheduled_task'
-        else:
-            return 'general'
-    
-    def _determine_severity(self, message: str) -> str:
-        """Determine severity level based on message content."""
-        message_lower = message.lower()
+        event_type = 'general'
+        for keyword, tag in self.EVENT_KEYWORDS:
+            if keyword in message_lower:
+                event_type = tag
+                break
         
-        if any(keyword in message_lower for keyword in ['blocked', 'security alert', 'banned']):
-            return 'critical'
-        elif any(keyword in message_lower for keyword in ['authentication failure', 'invalid login', 'error']):
-            return 'warning'
-        elif any(keyword in message_lower for keyword in ['connection closed', 'session opened', 'session closed']):
-            return 'info'
-        else:
-            return 'info'
+        severity = 'info'
+        for keyword, level in self.SEVERITY_KEYWORDS:
+            if keyword in message_lower:
+                severity = level
+                break
+        
+        return event_type, severity
     
     def get_statistics(self, df: pd.DataFrame) -> Dict:
         """Generate statistics for syslog data."""
         if df.empty:
             return {}
         
+        # One value_counts per column; unique counts and top-N lists are read off it
+        counts = {
+            column: df[column].value_counts()
+            for column in ('hostname', 'service', 'ip_address', 'event_type', 'severity')
+            if column in df.columns
+        }
+        
         stats = {
             'total_entries': len(df),
-            'unique_hosts': df['hostname'].nunique() if 'hostname' in df.columns else 0,
-            'unique_services': df['service'].nunique() if 'service' in df.columns else 0,
-            'unique_ips': df['ip_address'].nunique() if 'ip_address' in df.columns else 0,
+            'unique_hosts': len(counts['hostname']) if 'hostname' in counts else 0,
+            'unique_services': len(counts['service']) if 'service' in counts else 0,
+            'unique_ips': len(counts['ip_address']) if 'ip_address' in counts else 0,
             'date_range': {
                 'start': df['timestamp'].min() if 'timestamp' in df.columns else None,
                 'end': df['timestamp'].max() if 'timestamp' in df.columns else None
@@ -251,20 +387,19 @@ class SyslogParser:
         }
         
         # Event type distribution
-        if 'event_type' in df.columns:
-            stats['event_types'] = df['event_type'].value_counts().to_dict()
+        if 'event_type' in counts:
+            stats['event_types'] = counts['event_type'].to_dict()
         
         # Severity distribution
-        if 'severity' in df.columns:
-            stats['severity_levels'] = df['severity'].value_counts().to_dict()
+        if 'severity' in counts:
+            stats['severity_levels'] = counts['severity'].to_dict()
         
         # Top IP addresses
-        if 'ip_address' in df.columns:
-            top_ips = df[df['ip_address'].notna()]['ip_address'].value_counts().head(10)
-            stats['top_ips'] = top_ips.to_dict()
+        if 'ip_address' in counts:
+            stats['top_ips'] = counts['ip_address'].head(10).to_dict()
         
         # Top services
-        if 'service' in df.columns:
-            stats['top_services'] = df['service'].value_counts().head(10).to_dict()
+        if 'service' in counts:
+            stats['top_services'] = counts['service'].head(10).to_dict()
         
         return stats
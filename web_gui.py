@@ -12,16 +12,38 @@ from dash import dcc, html, Input, Output, State, dash_table, callback
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 import os
 import base64
 import io
+import re
 from datetime import datetime
+from dateutil.tz import tzlocal
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
 from log_analyzer import NimbleLogAnalyzer
 from json_log_analyzer import JSONNimbleLogAnalyzer
 from enhanced_ipinfo_service import enhanced_ipinfo_service, set_enhanced_ipinfo_token
 
+# Parsed logs are cached as Parquet next to the upload when pyarrow is installed
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Served by waitress when installed; Flask's development server otherwise
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# Worker threads for the WSGI server
+SERVER_THREADS = 8
+
 # Initialize Dash app
 app = dash.Dash(__name__, title="Nimble Streamer Log Analyzer")
 
@@ -29,6 +51,52 @@ app = dash.Dash(__name__, title="Nimble Streamer Log Analyzer")
 current_analyzer = None
 current_data = None
 
+# Base64 characters decoded per write when saving uploads (a multiple of 4)
+UPLOAD_DECODE_CHUNK = 4 * 1024 * 1024
+
+# User agents counted as mobile devices in the behavior tab
+MOBILE_UA_PATTERN = re.compile(r'Mobile|Android|iPhone', re.IGNORECASE)
+
+# Status values counted as streaming connection events
+STREAM_EVENT_PATTERN = re.compile(r'connect|disconnect|play|publish', re.IGNORECASE)
+
+# File extension at the end of a URL path, before any query string
+FILE_EXTENSION_PATTERN = re.compile(r'\.([a-zA-Z0-9]+)(?:\?|$)')
+
+# Filter-section outputs keyed by id(current_data); each entry keeps the frame
+# it was built from so a recycled id can never match
+_filter_cache = {}
+
+# Status-code histogram of current_data, cached the same way as _filter_cache
+_status_hist_cache = {}
+
+# Rendered tab contents per current_data: id -> (frame, {(tab, analysis timestamp): content})
+_tab_cache = {}
+
+# Bumped by every error path of the tab renderers; a render that moved it is not cached
+_render_failures = 0
+
+# Static fallbacks of the HTTP-error, streaming, data and export tabs, built once and shared
+NOTICE_STYLE = {'textAlign': 'center', 'color': '#7f8c8d', 'margin': '50px'}
+NO_HTTP_ERROR_DATA = html.Div([
+    html.P("📄 No data available for HTTP error analysis.", style={**NOTICE_STYLE, 'fontSize': '18px'})
+])
+NO_STREAMING_DATA = html.Div([html.P("No data available for streaming analytics.", style=NOTICE_STYLE)])
+NO_TABLE_DATA = html.Div([html.P("No data available.", style=NOTICE_STYLE)])
+NO_TABLE_COLUMNS = html.Div([html.P("No suitable columns found for display.", style=NOTICE_STYLE)])
+NO_REPORTS_DIR = html.P("No reports directory found. Run analysis first.")
+
+# Filtered/sorted row order for the data table: id -> (frame, {(sort, filter): positions})
+_table_view_cache = {}
+
+# IPinfo bulk_lookup results keyed by the frozenset of IPs looked up, so filter
+# changes that keep the same IPs skip the lookup entirely
+_ip_lookup_cache = {}
+IP_LOOKUP_CACHE_SIZE = 32
+
+# Runs cold IP lookups while the IP tab lays out its request-count chart
+_ip_lookup_pool = ThreadPoolExecutor(max_workers=2)
+
 # App layout
 app.layout = html.Div([
     # Header
@@ -200,10 +268,12 @@ app.layout = html.Div([
     # Store components for data
     dcc.Store(id='analysis-data'),
     dcc.Store(id='uploaded-filename'),
-    dcc.Store(id='filtered-data'),
-    dcc.Store(id='filter-options'),
 ], style={'fontFamily': 'Arial, sans-serif', 'margin': '20px', 'backgroundColor': '#f4f4f4'})
 
+# The data table only exists once the data tab renders; declaring it here lets
+# its paging callback validate without suppressing callback checks app-wide
+app.validation_layout = html.Div([app.layout, dash_table.DataTable(id='data-table')])
+
 # Callback for file upload
 @app.callback(
     [Output('upload-status', 'children'),
@@ -215,17 +285,21 @@ def update_upload_status(contents, filename):
     if contents is not None:
         # Save uploaded file
         content_type, content_string = contents.split(',')
-        decoded = base64.b64decode(content_string)
         
         # Create logs directory if it doesn't exist
         os.makedirs('logs', exist_ok=True)
         file_path = f'logs/{filename}'
         
         try:
+            # Decode in 4-character-aligned slices so the whole decoded file is
+            # never held in memory next to the base64 text. Each slice is far
+            # larger than the default write buffer, so it goes straight to the
+            # file; a bigger buffer would only be an extra allocation.
             with open(file_path, 'wb') as f:
-                f.write(decoded)
+                for start in range(0, len(content_string), UPLOAD_DECODE_CHUNK):
+                    f.write(base64.b64decode(content_string[start:start + UPLOAD_DECODE_CHUNK]))
             
-            file_size = len(decoded) / (1024 * 1024)  # Size in MB
+            file_size = os.path.getsize(file_path) / (1024 * 1024)  # Size in MB
             
             return [
                 html.Div([
@@ -245,12 +319,217 @@ def update_upload_status(contents, filename):
     
     return [html.P("No file uploaded yet.", style={'color': '#7f8c8d'})], None
 
+def _parsed_timestamps(data):
+    """Return the timestamps of data as datetime64, parsing only when needed."""
+    # The analyzers already store 'timestamp' as datetime64 (preferring 'datetime')
+    if pd.api.types.is_datetime64_any_dtype(data['timestamp']):
+        return data['timestamp']
+    if 'datetime' in data.columns and data['datetime'].notna().any():
+        return pd.to_datetime(data['datetime'], errors='coerce', cache=True)
+    return pd.to_datetime(data['timestamp'], errors='coerce', cache=True)
+
+def _precompute_time_columns(data):
+    """Derive the 'date' and 'hour' columns once so the tabs only read them."""
+    if data is None or 'timestamp' not in data.columns:
+        return
+    if 'date' in data.columns and 'hour' in data.columns:
+        return
+
+    timestamps = _parsed_timestamps(data)
+    if 'date' not in data.columns:
+        data['date'] = timestamps.dt.date
+    if 'hour' not in data.columns:
+        data['hour'] = timestamps.dt.hour.astype('Int8')
+
+# Repeated string columns stored as integer codes while the data stays loaded
+CATEGORY_COLUMNS = ('protocol', 'status', 'stream_alias', 'method', 'ip_address', 'server_ip',
+                    'stream_name', 'user_agent')
+
+def _compact_dtypes(data):
+    """Shrink current_data in place: categoricals for repeated strings, narrow integer columns."""
+    for col in CATEGORY_COLUMNS:
+        if col in data.columns and data[col].dtype == object:
+            data[col] = data[col].astype('category')
+    if 'status_code' in data.columns:
+        # Values that are not whole numbers in the HTTP range (arbitrary 'code' fields)
+        # become NA instead of failing the Int16 cast
+        codes = pd.to_numeric(data['status_code'], errors='coerce')
+        data['status_code'] = codes.where(codes.between(0, 999) & (codes % 1 == 0)).astype('Int16')
+    if 'bytes_sent' in data.columns and pd.api.types.is_integer_dtype(data['bytes_sent']):
+        data['bytes_sent'] = pd.to_numeric(data['bytes_sent'], downcast='integer')
+
+def _parsed_count(data):
+    """Rows whose parsed flag is True; every row when the format has no parsed column."""
+    if 'parsed' not in data.columns:
+        return len(data)
+    parsed = data['parsed']
+    if parsed.dtype == bool:
+        return int(np.count_nonzero(parsed.to_numpy()))
+    return int((parsed == True).sum())
+
+def _status_histogram(data):
+    """Count status codes with one np.bincount pass; index i holds the count of code i."""
+    cached = _status_hist_cache.get(id(data))
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    
+    codes = pd.to_numeric(data['status_code'], errors='coerce')
+    codes = codes[codes >= 0].to_numpy(dtype=np.int64)
+    hist = np.bincount(codes, minlength=600)
+    _status_hist_cache.clear()
+    _status_hist_cache[id(data)] = (data, hist)
+    return hist
+
+def _drop_file_cache(file_path):
+    """Ask the kernel to evict a fully parsed log from the page cache (POSIX only)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint; the analysis result is unaffected
+
+def _observed_counts(values):
+    """value_counts() without the zero rows a categorical keeps for values a row mask removed."""
+    counts = values.value_counts()
+    return counts[counts > 0]
+
+def _top_counts(values, k):
+    """
+    The k most frequent values, like value_counts().head(k) but without sorting every count.
+    
+    Values are factorized and counted with np.bincount; np.partition finds the
+    k-th largest count, so only the selected entries are sorted. Ties keep the
+    order of first appearance.
+    """
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    if len(counts) > k:
+        kth = np.partition(counts, len(counts) - k)[len(counts) - k]
+        above = np.flatnonzero(counts > kth)
+        tied = np.flatnonzero(counts == kth)[:k - len(above)]
+        idx = np.sort(np.concatenate([above, tied]))
+    else:
+        idx = np.arange(len(counts))
+    idx = idx[np.argsort(-counts[idx], kind='stable')]
+    return pd.Series(counts[idx], index=pd.Index(uniques[idx], name=values.name), name='count')
+
+def _bar_labels(index, max_len=None):
+    """String axis labels for a bar chart, cut to max_len characters with a trailing '...'."""
+    labels = index.astype(str)
+    if max_len is not None:
+        labels = labels.where(labels.str.len() <= max_len, labels.str.slice(0, max_len) + '...')
+    return labels.to_numpy(dtype=object)
+
+def _histogram_figure(values, title, x_title, y_title, bins=30):
+    """Histogram binned here with np.histogram, so the browser gets bins bar heights, not every value."""
+    values = np.asarray(values)
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) * 0.5, y=counts, width=edges[1] - edges[0]))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, bargap=0)
+    return fig
+
+# Most points a time-series chart sends to the browser
+MAX_CHART_POINTS = 2000
+
+def _downsample_series(counts, max_points=MAX_CHART_POINTS):
+    """
+    Reduce a sorted series to max_points with Largest-Triangle-Three-Buckets.
+    
+    LTTB keeps the first and last points and, from each bucket in between,
+    the point forming the largest triangle with its neighbours, so peaks and
+    dips survive while the payload stays bounded.
+    """
+    n = len(counts)
+    if n <= max_points or max_points < 3:
+        return counts
+    
+    index = counts.index
+    if pd.api.types.is_numeric_dtype(index):
+        x = index.to_numpy(dtype=float)
+    else:
+        x = pd.to_datetime(index).asi8.astype(float)
+    y = counts.to_numpy(dtype=float)
+    
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    keep = np.empty(max_points, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    selected = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) anchors the triangle
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(areas.argmax())
+        keep[i + 1] = selected
+    return counts.iloc[keep]
+
+# Parquet schema metadata key holding the detected log format; kept in the file
+# itself since DataFrame.attrs only reach Parquet from pandas 2.1 on
+PARQUET_FORMAT_KEY = b'nimble_format_detected'
+
+def _load_cached_log(analyzer, file_path):
+    """Restore analyzer.data from a Parquet cache newer than the log; True on success."""
+    cache_path = f"{file_path}.parquet"
+    if not PARQUET_AVAILABLE or not os.path.exists(cache_path):
+        return False
+    if os.path.getmtime(cache_path) <= os.path.getmtime(file_path):
+        return False
+    
+    try:
+        table = pq.read_table(cache_path)
+        data = table.to_pandas()
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable parse cache {cache_path}: {str(e)}")
+        return False
+    
+    format_detected = (table.schema.metadata or {}).get(PARQUET_FORMAT_KEY)
+    if format_detected is None:
+        # Written without the format (or by an older version); parse the log again
+        return False
+    
+    analyzer.format_detected = format_detected.decode('utf-8')
+    analyzer.data = data
+    print(f"📦 Loaded {len(data):,} parsed entries from {cache_path}")
+    return True
+
+def _save_cached_log(analyzer, file_path):
+    """Write analyzer.data to a zstd Parquet cache so a later run can skip parsing."""
+    if not PARQUET_AVAILABLE:
+        return
+    cache_path = f"{file_path}.parquet"
+    format_detected = getattr(analyzer, 'format_detected', None)
+    if format_detected is None:
+        return
+    try:
+        table = pa.Table.from_pandas(analyzer.data)
+        metadata = dict(table.schema.metadata or {})
+        metadata[PARQUET_FORMAT_KEY] = str(format_detected).encode('utf-8')
+        pq.write_table(table.replace_schema_metadata(metadata), cache_path, compression='zstd')
+    except Exception as e:
+        # Columns pyarrow cannot store (mixed object types) just mean no cache
+        print(f"⚠️ Could not write parse cache {cache_path}: {str(e)}")
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
 # Callback for analysis
 @app.callback(
     [Output('analysis-data', 'data'),
      Output('loading-output', 'children')],
     [Input('analyze-button', 'n_clicks')],
     [State('uploaded-filename', 'data')],
+    # Disable the button while a run is in progress so repeated clicks
+    # do not queue further full analyses behind it
+    running=[(Output('analyze-button', 'disabled'), True, False)],
     prevent_initial_call=True
 )
 def analyze_log_file(n_clicks, filename):
@@ -273,7 +552,9 @@ def analyze_log_file(n_clicks, filename):
         
         # Run analysis with error handling for each step
         try:
-            current_analyzer.read_log_file()
+            if not _load_cached_log(current_analyzer, file_path):
+                current_analyzer.read_log_file()
+                _save_cached_log(current_analyzer, file_path)
         except Exception as e:
             print(f"Read log file error: {str(e)}")
             return None, html.Div([
@@ -301,11 +582,22 @@ def analyze_log_file(n_clicks, filename):
         
         current_analyzer.create_visualizations()
         
-        current_data = current_analyzer.data.copy()  # Make a copy to avoid reference issues
+        # Shallow copy: column data is shared with the analyzer, while the columns
+        # added or converted below only replace entries in this frame
+        current_data = current_analyzer.data.copy(deep=False)
+        _precompute_time_columns(current_data)
+        _compact_dtypes(current_data)
+        _filter_cache.clear()
+        _status_hist_cache.clear()
+        _tab_cache.clear()
+        _table_view_cache.clear()
+        
+        # Everything now lives in current_data; the file's cached pages are dead weight
+        _drop_file_cache(file_path)
         
         # Calculate statistics safely
         total_entries = len(current_data)
-        parsed_entries = len(current_data[current_data['parsed'] == True]) if 'parsed' in current_data.columns else total_entries
+        parsed_entries = _parsed_count(current_data)
         
         # Determine format info
         format_info = ""
@@ -345,7 +637,6 @@ def analyze_log_file(n_clicks, filename):
 # Callback to show/hide filter section and populate filter options
 @app.callback(
     [Output('filter-section', 'style'),
-     Output('filter-options', 'data'),
      Output('status-filter', 'options'),
      Output('protocol-filter', 'options'),
      Output('stream-filter', 'options'),
@@ -355,66 +646,63 @@ def analyze_log_file(n_clicks, filename):
 )
 def update_filter_options(analysis_data):
     if analysis_data is None:
-        return {'display': 'none'}, None, [], [], [], None, None
+        return {'display': 'none'}, [], [], [], None, None
     
     try:
         global current_data
         if current_data is None or current_data.empty:
-            return {'display': 'none'}, None, [], [], [], None, None
+            return {'display': 'none'}, [], [], [], None, None
+        
+        # The options only depend on current_data, so reuse them until it changes
+        cached = _filter_cache.get(id(current_data))
+        if cached is not None and cached[0] is current_data:
+            return cached[1]
         
         # Show filter section
         filter_style = {'padding': '20px', 'backgroundColor': 'white', 'borderRadius': '10px',
                        'boxShadow': '0 2px 10px rgba(0,0,0,0.1)', 'marginBottom': '20px',
                        'display': 'block'}
         
-        # Prepare filter options
-        filter_options = {}
-        
         # Status options
         status_options = []
         if 'status' in current_data.columns:
             unique_statuses = current_data['status'].dropna().unique()
             status_options = [{'label': status, 'value': status} for status in sorted(unique_statuses)]
-            filter_options['statuses'] = unique_statuses.tolist()
         
         # Protocol options
         protocol_options = []
         if 'protocol' in current_data.columns:
             unique_protocols = current_data['protocol'].dropna().unique()
             protocol_options = [{'label': protocol, 'value': protocol} for protocol in sorted(unique_protocols)]
-            filter_options['protocols'] = unique_protocols.tolist()
         
         # Stream options
         stream_options = []
         if 'stream_alias' in current_data.columns:
-            unique_streams = current_data['stream_alias'].dropna().unique()
-            # Limit to top 100 streams for performance
-            stream_counts = current_data['stream_alias'].value_counts().head(100)
+            # Limit to top 100 streams for performance; one value_counts pass
+            # yields both the labels and the counts
+            stream_counts = _top_counts(current_data['stream_alias'], 100)
             stream_options = [{'label': f"{stream} ({count})", 'value': stream} 
                              for stream, count in stream_counts.items()]
-            filter_options['streams'] = stream_counts.index.tolist()
         
         # Date range
         start_date = None
         end_date = None
         if 'timestamp' in current_data.columns:
             try:
-                # Try to use datetime column first if available, otherwise parse timestamp
-                if 'datetime' in current_data.columns and not current_data['datetime'].isna().all():
-                    timestamps = pd.to_datetime(current_data['datetime'], errors='coerce')
-                else:
-                    timestamps = pd.to_datetime(current_data['timestamp'], errors='coerce')
+                timestamps = _parsed_timestamps(current_data)
                 start_date = timestamps.min().date()
                 end_date = timestamps.max().date()
-                filter_options['date_range'] = [start_date.isoformat(), end_date.isoformat()]
             except Exception as e:
                 print(f"Date range error: {str(e)}")
         
-        return filter_style, filter_options, status_options, protocol_options, stream_options, start_date, end_date
+        result = (filter_style, status_options, protocol_options, stream_options, start_date, end_date)
+        _filter_cache.clear()
+        _filter_cache[id(current_data)] = (current_data, result)
+        return result
         
     except Exception as e:
         print(f"Filter options error: {str(e)}")
-        return {'display': 'none'}, None, [], [], [], None, None
+        return {'display': 'none'}, [], [], [], None, None
 
 # Callback for tab content
 @app.callback(
@@ -441,28 +729,25 @@ def render_tab_content(active_tab, analysis_data):
                               'margin': '50px'})
             ])
         
-        if active_tab == 'summary-tab':
-            return render_summary_tab(analysis_data)
-        elif active_tab == 'time-tab':
-            return render_time_tab()
-        elif active_tab == 'ip-tab':
-            return render_ip_tab()
-        elif active_tab == 'http-errors-tab':
-            return render_http_errors_tab()
-        elif active_tab == 'error-tab':
-            return render_error_tab()
-        elif active_tab == 'behavior-tab':
-            return render_behavior_tab()
-        elif active_tab == 'content-tab':
-            return render_content_tab()
-        elif active_tab == 'streaming-tab':
-            return render_streaming_tab()
-        elif active_tab == 'data-tab':
-            return render_data_tab()
-        elif active_tab == 'export-tab':
+        # The export tab lists files on disk, so it is always rebuilt
+        if active_tab == 'export-tab':
             return render_export_tab()
         
-        return html.Div("Select a tab to view content")
+        # The other tabs only read current_data, so a repeated click reuses the rendered content
+        entry = _tab_cache.get(id(current_data))
+        if entry is None or entry[0] is not current_data:
+            _tab_cache.clear()
+            entry = _tab_cache[id(current_data)] = (current_data, {})
+        
+        key = (active_tab, analysis_data.get('analysis_timestamp'))
+        if key in entry[1]:
+            return entry[1][key]
+        
+        failures = _render_failures
+        content = _render_tab(active_tab, analysis_data)
+        if _render_failures == failures:
+            entry[1][key] = content
+        return content
         
     except Exception as e:
         print(f"Tab rendering error: {str(e)}")  # Log to console
@@ -472,9 +757,32 @@ def render_tab_content(active_tab, analysis_data):
                           'margin': '50px'})
         ])
 
+def _render_tab(active_tab, analysis_data):
+    """Build the content of one tab from current_data."""
+    if active_tab == 'summary-tab':
+        return render_summary_tab(analysis_data)
+    elif active_tab == 'time-tab':
+        return render_time_tab()
+    elif active_tab == 'ip-tab':
+        return render_ip_tab()
+    elif active_tab == 'http-errors-tab':
+        return render_http_errors_tab()
+    elif active_tab == 'error-tab':
+        return render_error_tab()
+    elif active_tab == 'behavior-tab':
+        return render_behavior_tab()
+    elif active_tab == 'content-tab':
+        return render_content_tab()
+    elif active_tab == 'streaming-tab':
+        return render_streaming_tab()
+    elif active_tab == 'data-tab':
+        return render_data_tab()
+    
+    return html.Div("Select a tab to view content")
+
 def render_summary_tab(analysis_data):
     """Render the summary report tab."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or current_data.empty:
@@ -486,29 +794,37 @@ def render_summary_tab(analysis_data):
         parse_rate = (parsed_entries / total_entries * 100) if total_entries > 0 else 0
         
         # Status code analysis
-        status_stats = []
+        status_rows = []
+        status_note = "No status code data available"
         if 'status_code' in current_data.columns:
             try:
-                status_counts = current_data['status_code'].value_counts()
-                for status, count in status_counts.head(10).items():
-                    if status and str(status).strip():  # Check if status is valid
-                        status_stats.append(html.Tr([
-                            html.Td(str(status)),
-                            html.Td(f"{count:,}"),
-                            html.Td(f"{(count/total_entries)*100:.2f}%" if total_entries > 0 else "0%")
-                        ]))
+                hist = _status_histogram(current_data)
+                # Missing and unparseable codes never reach the histogram; skipping
+                # slot 0 leaves only valid statuses, with no per-row checks
+                present = np.flatnonzero(hist[1:]) + 1
+                status_counts = pd.Series(hist[present], index=present).sort_values(ascending=False, kind='stable')
+                top_statuses = status_counts.head(10)
+                status_rows = pd.DataFrame({
+                    'Status Code': top_statuses.index.astype(str),
+                    'Count': top_statuses.map('{:,}'.format).to_numpy(),
+                    'Percentage': ((top_statuses / total_entries * 100).map('{:.2f}%'.format).to_numpy()
+                                   if total_entries > 0 else '0%')
+                }).to_dict('records')
             except Exception as e:
+                _render_failures += 1
                 print(f"Status code analysis error: {str(e)}")
-                status_stats = [html.Tr([
-                    html.Td("N/A", colSpan=3, style={'textAlign': 'center', 'color': '#7f8c8d'})
-                ])]
+                status_note = "N/A"
         
-        # If no status stats, show N/A row
-        if not status_stats:
-            status_stats = [html.Tr([
-                html.Td("No status code data available", colSpan=3, 
-                       style={'textAlign': 'center', 'color': '#7f8c8d'})
-            ])]
+        # One DataTable built from records; a note when there is nothing to show
+        if status_rows:
+            status_table = dash_table.DataTable(
+                data=status_rows,  # type: ignore
+                columns=[{'name': col, 'id': col} for col in ('Status Code', 'Count', 'Percentage')],
+                style_cell={'textAlign': 'left', 'padding': '10px'},
+                style_header={'backgroundColor': '#3498db', 'color': 'white', 'fontWeight': 'bold'}
+            )
+        else:
+            status_table = html.P(status_note, style={'textAlign': 'center', 'color': '#7f8c8d'})
         
         return html.Div([
             # Key metrics
@@ -537,20 +853,11 @@ def render_summary_tab(analysis_data):
             
             # Status code table
             html.H4("📊 Status Code Distribution"),
-            html.Table([
-                html.Thead([
-                    html.Tr([
-                        html.Th("Status Code", style={'padding': '10px', 'borderBottom': '2px solid #3498db'}),
-                        html.Th("Count", style={'padding': '10px', 'borderBottom': '2px solid #3498db'}),
-                        html.Th("Percentage", style={'padding': '10px', 'borderBottom': '2px solid #3498db'})
-                    ])
-                ]),
-                html.Tbody(status_stats)
-            ], style={'width': '100%', 'borderCollapse': 'collapse', 'margin': '20px 0',
-                     'boxShadow': '0 2px 10px rgba(0,0,0,0.1)'}),
+            html.Div(status_table, style={'margin': '20px 0', 'boxShadow': '0 2px 10px rgba(0,0,0,0.1)'}),
         ])
         
     except Exception as e:
+        _render_failures += 1
         print(f"Summary tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error generating summary: {str(e)}", 
@@ -559,7 +866,7 @@ def render_summary_tab(analysis_data):
 
 def render_time_tab():
     """Render the time analysis tab."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or 'timestamp' not in current_data.columns:
@@ -568,57 +875,50 @@ def render_time_tab():
                        style={'textAlign': 'center', 'color': '#7f8c8d', 'margin': '50px'})
             ])
         
+        # Normally done in analyze_log_file; a no-op once the columns exist
+        _precompute_time_columns(current_data)
+        
         charts = []
         
         # Hourly distribution chart
         if 'hour' in current_data.columns:
             try:
-                hourly_counts = current_data['hour'].value_counts().sort_index()
+                hourly_counts = current_data['hour'].value_counts(sort=False).sort_index()
                 
                 if not hourly_counts.empty:
-                    fig_hourly = px.bar(
-                        x=hourly_counts.index,
-                        y=hourly_counts.values,
-                        title="Request Distribution by Hour",
-                        labels={'x': 'Hour of Day', 'y': 'Number of Requests'}
-                    )
-                    fig_hourly.update_layout(showlegend=False, height=400)
+                    fig_hourly = go.Figure(go.Bar(x=hourly_counts.index.to_numpy(dtype=np.int64),
+                                                  y=hourly_counts.to_numpy()))
+                    fig_hourly.update_layout(title="Request Distribution by Hour", xaxis_title="Hour of Day",
+                                             yaxis_title="Number of Requests", showlegend=False, height=400)
                     charts.append(dcc.Graph(figure=fig_hourly))
                     
             except Exception as e:
+                _render_failures += 1
                 print(f"Hourly chart error: {str(e)}")
                 charts.append(html.P(f"Error creating hourly chart: {str(e)}", 
                                     style={'color': '#e74c3c'}))
         
         # Daily timeline
         try:
-            # Create date column if it doesn't exist
-            if 'date' not in current_data.columns:
-                if 'datetime' in current_data.columns and not current_data['datetime'].isna().all():
-                    current_data['date'] = pd.to_datetime(current_data['datetime'], errors='coerce').dt.date
-                else:
-                    current_data['date'] = pd.to_datetime(current_data['timestamp'], errors='coerce').dt.date
-            
             # Filter out null dates
-            valid_dates = current_data.dropna(subset=['date'])
+            valid_dates = current_data['date'].dropna()
             
             if not valid_dates.empty:
-                daily_counts = valid_dates['date'].value_counts().sort_index()
+                daily_counts = _downsample_series(valid_dates.value_counts(sort=False).sort_index())
                 
                 if not daily_counts.empty:
-                    fig_timeline = px.line(
-                        x=daily_counts.index,
-                        y=daily_counts.values,
-                        title="Daily Request Volume Over Time",
-                        labels={'x': 'Date', 'y': 'Number of Requests'}
-                    )
-                    fig_timeline.update_layout(height=400)
+                    # WebGL trace: the browser draws long timelines without building SVG paths
+                    fig_timeline = go.Figure(go.Scattergl(x=daily_counts.index.to_numpy(),
+                                                          y=daily_counts.to_numpy(), mode='lines'))
+                    fig_timeline.update_layout(title="Daily Request Volume Over Time", xaxis_title="Date",
+                                               yaxis_title="Number of Requests", height=400)
                     
                     if charts:  # Add separator if there are other charts
                         charts.append(html.Hr())
                     charts.append(dcc.Graph(figure=fig_timeline))
                     
         except Exception as e:
+            _render_failures += 1
             print(f"Timeline chart error: {str(e)}")
             charts.append(html.P(f"Error creating timeline chart: {str(e)}", 
                                 style={'color': '#e74c3c'}))
@@ -632,6 +932,7 @@ def render_time_tab():
         return html.Div(charts)
         
     except Exception as e:
+        _render_failures += 1
         print(f"Time tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading time analysis: {str(e)}", 
@@ -641,7 +942,7 @@ def render_time_tab():
 
 def render_error_tab():
     """Render the error analysis tab."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or current_data.empty:
@@ -655,50 +956,57 @@ def render_error_tab():
         # Error analysis
         if 'status_code' in current_data.columns:
             try:
-                # Filter errors (4xx and 5xx)
-                errors = current_data[current_data['status_code'] >= 400]
+                # Errors (4xx and 5xx) come from the status histogram; the other
+                # columns are only read through a row mask, never copied as a frame
+                hist = _status_histogram(current_data)
+                error_total = int(hist[400:].sum())
                 
-                if not errors.empty:
+                if error_total:
+                    status_codes = pd.to_numeric(current_data['status_code'], errors='coerce')
+                    error_mask = (status_codes >= 400).to_numpy(dtype=bool, na_value=False)
+                    
                     # Error distribution chart
-                    error_counts = errors['status_code'].value_counts().sort_index()
+                    error_codes = np.flatnonzero(hist[400:]) + 400
+                    error_counts = pd.Series(hist[error_codes], index=error_codes)
                     
-                    fig_errors = px.bar(
-                        x=error_counts.index,
-                        y=error_counts.values,
-                        title="Error Status Code Distribution",
-                        labels={'x': 'Status Code', 'y': 'Number of Errors'},
-                        color=error_counts.values,
-                        color_continuous_scale='Reds'
-                    )
-                    fig_errors.update_layout(showlegend=False, height=400)
+                    fig_errors = go.Figure(go.Bar(
+                        x=error_codes,
+                        y=error_counts.to_numpy(),
+                        marker={'color': error_counts.to_numpy(), 'colorscale': 'Reds', 'showscale': True}
+                    ))
+                    fig_errors.update_layout(title="Error Status Code Distribution", xaxis_title="Status Code",
+                                             yaxis_title="Number of Errors", showlegend=False, height=400)
                     charts.append(dcc.Graph(figure=fig_errors))
                     
                     # Error timeline
-                    if 'hour' in errors.columns:
-                        hourly_errors = errors.groupby('hour').size()
+                    if 'hour' in current_data.columns:
+                        hourly_errors = current_data['hour'][error_mask].value_counts(sort=False).sort_index()
                         
-                        fig_error_timeline = px.line(
-                            x=hourly_errors.index,
-                            y=hourly_errors.values,
-                            title="Error Distribution by Hour",
-                            labels={'x': 'Hour of Day', 'y': 'Number of Errors'}
-                        )
-                        fig_error_timeline.update_traces(line_color='red')
-                        fig_error_timeline.update_layout(height=400)
+                        fig_error_timeline = go.Figure(go.Scatter(
+                            x=hourly_errors.index.to_numpy(dtype=np.int64),
+                            y=hourly_errors.to_numpy(),
+                            mode='lines',
+                            line={'color': 'red'}
+                        ))
+                        fig_error_timeline.update_layout(title="Error Distribution by Hour", xaxis_title="Hour of Day",
+                                                         yaxis_title="Number of Errors", height=400)
                         charts.append(html.Hr())
                         charts.append(dcc.Graph(figure=fig_error_timeline))
                     
                     # Top error sources
-                    if 'ip_address' in errors.columns:
-                        error_ips = errors['ip_address'].value_counts().head(10)
+                    if 'ip_address' in current_data.columns:
+                        error_ips = _top_counts(current_data['ip_address'][error_mask], 10)
                         
                         if not error_ips.empty:
                             charts.append(html.Hr())
                             charts.append(html.H4("🚨 Top Error Sources"))
+                            error_sources = pd.DataFrame({
+                                'IP Address': error_ips.index,
+                                'Error Count': error_ips.to_numpy(),
+                                'Percentage': (error_ips / error_total * 100).map('{:.2f}%'.format).to_numpy()
+                            })
                             charts.append(dash_table.DataTable(
-                                data=[{'IP Address': ip, 'Error Count': count, 
-                                      'Percentage': f"{(count/len(errors))*100:.2f}%"} 
-                                      for ip, count in error_ips.items()],  # type: ignore
+                                data=error_sources.to_dict('records'),  # type: ignore
                                 columns=[
                                     {'name': 'IP Address', 'id': 'IP Address'},
                                     {'name': 'Error Count', 'id': 'Error Count'},
@@ -715,6 +1023,7 @@ def render_error_tab():
                     ]))
                     
             except Exception as e:
+                _render_failures += 1
                 print(f"Error analysis error: {str(e)}")
                 charts.append(html.P(f"Error analyzing errors: {str(e)}", 
                                     style={'color': '#e74c3c'}))
@@ -726,6 +1035,7 @@ def render_error_tab():
         return html.Div(charts)
         
     except Exception as e:
+        _render_failures += 1
         print(f"Error tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading error analysis: {str(e)}", 
@@ -735,7 +1045,7 @@ def render_error_tab():
 
 def render_behavior_tab():
     """Render the user behavior analysis tab."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or current_data.empty:
@@ -749,8 +1059,11 @@ def render_behavior_tab():
         # User agent analysis
         if 'user_agent' in current_data.columns:
             try:
-                # Basic device type detection
-                mobile_count = len(current_data[current_data['user_agent'].str.contains('Mobile|Android|iPhone', case=False, na=False)])
+                # Basic device type detection: match each distinct user agent once
+                # and weight it by its request count
+                ua_counts = current_data['user_agent'].value_counts(sort=False)
+                is_mobile = ua_counts.index.str.contains(MOBILE_UA_PATTERN, na=False)
+                mobile_count = int(ua_counts[is_mobile].sum())
                 desktop_count = len(current_data) - mobile_count
                 
                 # Device type pie chart
@@ -763,25 +1076,23 @@ def render_behavior_tab():
                 charts.append(dcc.Graph(figure=fig_devices))
                 
             except Exception as e:
+                _render_failures += 1
                 print(f"User agent analysis error: {str(e)}")
         
         # Request size analysis
         if 'bytes_sent' in current_data.columns:
             try:
-                # Convert to MB for better readability
-                current_data['mb_sent'] = current_data['bytes_sent'] / (1024 * 1024)
+                # Convert to MB for better readability; float32 is plenty for binning
+                bytes_sent = pd.to_numeric(current_data['bytes_sent'], errors='coerce')
+                mb_sent = bytes_sent.to_numpy(np.float32, na_value=np.nan) * np.float32(1.0 / (1024 * 1024))
                 
-                fig_bandwidth = px.histogram(
-                    current_data, 
-                    x='mb_sent',
-                    title="Bandwidth Usage Distribution (MB per request)",
-                    labels={'mb_sent': 'MB Sent', 'count': 'Number of Requests'},
-                    nbins=30
-                )
+                fig_bandwidth = _histogram_figure(mb_sent, "Bandwidth Usage Distribution (MB per request)",
+                                                  'MB Sent', 'Number of Requests')
                 charts.append(html.Hr())
                 charts.append(dcc.Graph(figure=fig_bandwidth))
                 
             except Exception as e:
+                _render_failures += 1
                 print(f"Bandwidth analysis error: {str(e)}")
         
         # Geographic insights (if available)
@@ -810,6 +1121,7 @@ def render_behavior_tab():
                 ]))
                 
             except Exception as e:
+                _render_failures += 1
                 print(f"User metrics error: {str(e)}")
         
         if not charts:
@@ -819,6 +1131,7 @@ def render_behavior_tab():
         return html.Div(charts)
         
     except Exception as e:
+        _render_failures += 1
         print(f"Behavior tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading behavior analysis: {str(e)}", 
@@ -828,7 +1141,7 @@ def render_behavior_tab():
 
 def render_content_tab():
     """Render the content performance analysis tab."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or current_data.empty:
@@ -844,26 +1157,24 @@ def render_content_tab():
             try:
                 url_column = 'url' if 'url' in current_data.columns else 'request'
                 
-                # Most requested content
-                popular_content = current_data[url_column].value_counts().head(15)
+                # Most requested content; the full counts also fill the table below
+                content_counts = current_data[url_column].value_counts()
+                popular_content = content_counts.head(15)
                 
                 if not popular_content.empty:
-                    fig_content = px.bar(
-                        x=popular_content.values,
-                        y=[str(url)[:50] + '...' if len(str(url)) > 50 else str(url) 
-                           for url in popular_content.index],
-                        orientation='h',
-                        title="Most Requested Content (Top 15)",
-                        labels={'x': 'Request Count', 'y': 'Content/URL'}
-                    )
-                    fig_content.update_layout(height=600)
+                    fig_content = go.Figure(go.Bar(x=popular_content.to_numpy(),
+                                                   y=_bar_labels(popular_content.index, 50),
+                                                   orientation='h'))
+                    fig_content.update_layout(title="Most Requested Content (Top 15)", xaxis_title="Request Count",
+                                              yaxis_title="Content/URL", height=600, uirevision='content')
                     charts.append(dcc.Graph(figure=fig_content))
                     
                     # Content success rates
                     if 'status_code' in current_data.columns:
-                        success_rates = current_data.groupby(url_column).apply(
-                            lambda x: (x['status_code'] == 200).sum() / len(x) * 100
-                        ).sort_values(ascending=False)
+                        # Share of 200 responses per URL as one grouped mean
+                        is_ok = (current_data['status_code'] == 200).to_numpy(dtype=bool, na_value=False)
+                        success_rates = (pd.Series(is_ok, index=current_data.index)
+                                         .groupby(current_data[url_column]).mean() * 100).sort_values(ascending=False)
                         
                         top_performing = success_rates.head(10)
                         
@@ -872,7 +1183,7 @@ def render_content_tab():
                         charts.append(dash_table.DataTable(
                             data=[{'Content': str(content)[:80] + ('...' if len(str(content)) > 80 else ''), 
                                   'Success Rate': f"{rate:.1f}%", 
-                                  'Total Requests': current_data[current_data[url_column] == content].shape[0]} 
+                                  'Total Requests': int(content_counts.get(content, 0))} 
                                   for content, rate in top_performing.items()],
                             columns=[
                                 {'name': 'Content/URL', 'id': 'Content'},
@@ -884,6 +1195,7 @@ def render_content_tab():
                         ))
                 
             except Exception as e:
+                _render_failures += 1
                 print(f"Content analysis error: {str(e)}")
                 charts.append(html.P(f"Error analyzing content: {str(e)}", 
                                     style={'color': '#e74c3c'}))
@@ -893,9 +1205,12 @@ def render_content_tab():
             try:
                 url_column = 'url' if 'url' in current_data.columns else 'request'
                 
-                # Extract file extensions
-                file_extensions = current_data[url_column].str.extract(r'\.([a-zA-Z0-9]+)(?:\?|$)')[0].fillna('no-extension')
-                extension_counts = file_extensions.value_counts().head(10)
+                # Extract file extensions once per distinct URL, weighted by its request count
+                url_counts = current_data[url_column].value_counts(dropna=False)
+                file_extensions = (url_counts.index.to_series().str.extract(FILE_EXTENSION_PATTERN)[0]
+                                   .fillna('no-extension').to_numpy())
+                extension_counts = (url_counts.groupby(file_extensions, sort=False).sum()
+                                    .sort_values(ascending=False, kind='stable').head(10))
                 
                 if not extension_counts.empty:
                     fig_extensions = px.pie(
@@ -907,6 +1222,7 @@ def render_content_tab():
                     charts.append(dcc.Graph(figure=fig_extensions))
                 
             except Exception as e:
+                _render_failures += 1
                 print(f"File type analysis error: {str(e)}")
         
         if not charts:
@@ -916,6 +1232,7 @@ def render_content_tab():
         return html.Div(charts)
         
     except Exception as e:
+        _render_failures += 1
         print(f"Content tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading content analysis: {str(e)}", 
@@ -925,7 +1242,7 @@ def render_content_tab():
 
 def render_ip_tab():
     """Render the IP analysis tab with IPinfo integration."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or 'ip_address' not in current_data.columns:
@@ -935,7 +1252,8 @@ def render_ip_tab():
             ])
         
         # Filter out null/empty IP addresses
-        valid_ips = current_data[current_data['ip_address'].notna() & (current_data['ip_address'] != '')]
+        valid_ips = current_data['ip_address']
+        valid_ips = valid_ips[valid_ips.notna() & (valid_ips != '')]
         
         if valid_ips.empty:
             return html.Div([
@@ -943,21 +1261,48 @@ def render_ip_tab():
                        style={'textAlign': 'center', 'color': '#7f8c8d', 'margin': '50px'})
             ])
         
-        # Get top IPs
-        top_ips = valid_ips['ip_address'].value_counts().head(20)
+        # Requests per IP; every breakdown below is aggregated from these counts
+        # instead of joining lookup results back onto each request row
+        ip_counts = _observed_counts(valid_ips)
+        top_ips = ip_counts.head(20)
         
         # Try to enrich with IPinfo data
         ipinfo_enabled = True
         enriched_data = None
+        geo_map = {}
+        lookup = None
+        
+        # Use the enhanced IPinfo service for faster offline lookups
+        sample_ips = valid_ips.unique()[:100]  # Increased limit since offline is faster
+        lookup_key = frozenset(sample_ips)
+        enriched_sample_dict = _ip_lookup_cache.get(lookup_key)
+        if enriched_sample_dict is None:
+            lookup = _ip_lookup_pool.submit(enhanced_ipinfo_service.bulk_lookup, list(sample_ips))
+        
+        # Create components list
+        components = []
+        
+        # Top IPs Chart, built while a cold lookup is still running
+        if not top_ips.empty:
+            fig_ips = go.Figure(go.Bar(x=top_ips.to_numpy(), y=_bar_labels(top_ips.index), orientation='h'))
+            fig_ips.update_layout(title="Top 20 IP Addresses by Request Count", xaxis_title="Number of Requests",
+                                  yaxis_title="IP Address", height=600, uirevision='ips')
+            components.append(dcc.Graph(figure=fig_ips))
+            components.append(html.Hr())
         
         try:
-            # Use the enhanced IPinfo service for faster offline lookups
-            sample_ips = valid_ips['ip_address'].unique()[:100]  # Increased limit since offline is faster
-            enriched_sample_dict = enhanced_ipinfo_service.bulk_lookup(sample_ips.tolist())
+            if lookup is not None:
+                enriched_sample_dict = lookup.result()
+                if len(_ip_lookup_cache) >= IP_LOOKUP_CACHE_SIZE:
+                    _ip_lookup_cache.clear()
+                _ip_lookup_cache[lookup_key] = enriched_sample_dict
             
-            # Convert to DataFrame format
+            # Convert to DataFrame format, in order of first appearance in the log
             enriched_list = []
-            for ip, info in enriched_sample_dict.items():
+            for ip in sample_ips:
+                info = enriched_sample_dict.get(ip)
+                if info is None:
+                    continue
                 enriched_list.append({
                     'ip': ip,
                     'country': info.get('country', 'Unknown'),
@@ -975,41 +1320,21 @@ def render_ip_tab():
                     'source': info.get('source', 'unknown')
                 })
             
-            enriched_sample = pd.DataFrame(enriched_list)
-            
-            # Merge back with original data
-            enriched_data = valid_ips.merge(
-                enriched_sample[['ip', 'country', 'country_name', 'country_code', 'region', 'city', 'org', 'asn', 'as_name', 'as_domain', 'continent', 'continent_code', 'is_private', 'source']], 
-                left_on='ip_address', 
-                right_on='ip', 
-                how='left'
-            )
+            enriched_data = pd.DataFrame(enriched_list).set_index('ip', drop=False)
+            enriched_data['requests'] = ip_counts.reindex(enriched_data.index).to_numpy()
+            geo_map = {row['ip']: row for row in enriched_list}
             
         except Exception as e:
+            _render_failures += 1
             print(f"Enhanced IPinfo enrichment failed: {e}")
             ipinfo_enabled = False
         
-        # Create components list
-        components = []
-        
-        # Top IPs Chart
-        if not top_ips.empty:
-            fig_ips = px.bar(
-                x=top_ips.values,
-                y=top_ips.index,
-                orientation='h',
-                title="Top 20 IP Addresses by Request Count",
-                labels={'x': 'Number of Requests', 'y': 'IP Address'}
-            )
-            fig_ips.update_layout(height=600)
-            components.append(dcc.Graph(figure=fig_ips))
-            components.append(html.Hr())
-        
         # Country Analysis (if IPinfo data available)
         if enriched_data is not None and 'country' in enriched_data.columns:
             country_data = enriched_data[enriched_data['country'].notna() & (enriched_data['country'] != 'Unknown')]
             if not country_data.empty:
-                country_stats = country_data['country'].value_counts().head(15)
+                country_stats = (country_data.groupby('country', sort=False)['requests'].sum()
+                                 .sort_values(ascending=False, kind='stable').head(15))
                 
                 if len(country_stats) > 0:
                     # Country pie chart
@@ -1029,17 +1354,14 @@ def render_ip_tab():
         if enriched_data is not None and 'org' in enriched_data.columns:
             org_data = enriched_data[enriched_data['org'].notna() & (enriched_data['org'] != 'Unknown')]
             if not org_data.empty:
-                org_stats = org_data['org'].value_counts().head(10)
+                org_stats = (org_data.groupby('org', sort=False)['requests'].sum()
+                             .sort_values(ascending=False, kind='stable').head(10))
                 
                 if len(org_stats) > 0:
-                    fig_orgs = px.bar(
-                        x=org_stats.values,
-                        y=org_stats.index,
-                        orientation='h',
-                        title="🏢 Top ISPs/Organizations",
-                        labels={'x': 'Number of Requests', 'y': 'Organization'}
-                    )
-                    fig_orgs.update_layout(height=400)
+                    fig_orgs = go.Figure(go.Bar(x=org_stats.to_numpy(), y=_bar_labels(org_stats.index),
+                                                orientation='h'))
+                    fig_orgs.update_layout(title="🏢 Top ISPs/Organizations", xaxis_title="Number of Requests",
+                                           yaxis_title="Organization", height=400, uirevision='orgs')
                     components.extend([
                         html.H4("🏢 ISP/Organization Analysis", style={'color': '#2980b9'}),
                         dcc.Graph(figure=fig_orgs),
@@ -1060,13 +1382,11 @@ def render_ip_tab():
             }
             
             # Add geographic info if available
-            if enriched_data is not None:
-                ip_info = enriched_data[enriched_data['ip_address'] == ip]
-                if not ip_info.empty:
-                    first_match = ip_info.iloc[0]
-                    row['Country'] = first_match.get('country', 'Unknown')
-                    row['City'] = first_match.get('city', 'Unknown')
-                    row['ISP/Org'] = first_match.get('org', 'Unknown')
+            info = geo_map.get(ip)
+            if info is not None:
+                row['Country'] = info.get('country', 'Unknown')
+                row['City'] = info.get('city', 'Unknown')
+                row['ISP/Org'] = info.get('org', 'Unknown')
             
             table_data.append(row)
         
@@ -1106,6 +1426,7 @@ def render_ip_tab():
         return html.Div(components)
                 
     except Exception as e:
+        _render_failures += 1
         print(f"IP analysis error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading IP analysis: {str(e)}", 
@@ -1113,29 +1434,57 @@ def render_ip_tab():
                           'margin': '50px'})
         ])
 
+def _flag_mask(data, column):
+    """Row mask where a True/False flag column is True; all False when it is missing."""
+    if column not in data.columns:
+        return np.zeros(len(data), dtype=bool)
+    return (data[column] == True).to_numpy(dtype=bool, na_value=False)
+
+def _present_columns(data, *columns):
+    """The given column names that exist in data, in order."""
+    return [col for col in columns if col in data.columns]
+
+def _interleave(sections, separator):
+    """Yield the components of each non-empty section, with separator() between sections."""
+    first = True
+    for section in sections:
+        if not section:
+            continue
+        if not first:
+            yield separator()
+        first = False
+        yield from section
+
 def render_http_errors_tab():
     """Render the HTTP errors and streaming analysis tab."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or current_data.empty:
-            return html.Div([
-                html.P("📄 No data available for HTTP error analysis.", 
-                       style={'textAlign': 'center', 'color': '#7f8c8d', 'fontSize': '18px',
-                              'margin': '50px'})
-            ])
-        
-        # Filter data with HTTP errors
-        http_errors_df = current_data[current_data.get('has_http_error', False) == True]
-        streaming_df = current_data[current_data.get('has_stream_info', False) == True]
-        server_ips_df = current_data[current_data.get('has_server_ip', False) == True]
-        error_streaming_df = current_data[(current_data.get('has_http_error', False) == True) & (current_data.get('has_stream_info', False) == True)]
+            return NO_HTTP_ERROR_DATA
+        
+        # Row masks for each flag, computed once; slices below only take the
+        # columns each section reads
+        error_mask = _flag_mask(current_data, 'has_http_error')
+        stream_mask = _flag_mask(current_data, 'has_stream_info')
+        server_mask = _flag_mask(current_data, 'has_server_ip')
+        error_stream_mask = error_mask & stream_mask
+        server_stream_mask = server_mask & stream_mask
+        
+        http_errors_df = current_data.loc[error_mask, _present_columns(current_data, 'http_error_code', 'error_type')]
+        streaming_df = current_data.loc[stream_mask, _present_columns(current_data, 'stream_name')]
+        server_ips_df = current_data.loc[server_mask, _present_columns(current_data, 'server_ip')]
+        error_streaming_df = current_data.loc[error_stream_mask, _present_columns(
+            current_data, 'http_error_code', 'server_ip', 'stream_name', 'error_url')]
         
         # HTTP Error Statistics
         error_stats = []
         if not http_errors_df.empty:
             total_errors = len(http_errors_df)
             error_codes = http_errors_df['http_error_code'].value_counts()
+            # Error type of the first row with each code
+            if 'error_type' in http_errors_df.columns:
+                error_types = http_errors_df.drop_duplicates('http_error_code').set_index('http_error_code')['error_type']
             
             error_stats.extend([
                 html.H4("🚨 HTTP Error Summary", style={'color': '#e74c3c'}),
@@ -1144,7 +1493,7 @@ def render_http_errors_tab():
             ])
             
             for code, count in error_codes.head(10).items():
-                error_type = http_errors_df[http_errors_df['http_error_code'] == code]['error_type'].iloc[0] if 'error_type' in http_errors_df.columns else f"HTTP {code}"
+                error_type = error_types[code] if 'error_type' in http_errors_df.columns else f"HTTP {code}"
                 percentage = (count / total_errors) * 100
                 error_stats.append(
                     html.P(f"🔴 {code} ({error_type}): {count:,} ({percentage:.1f}%)", 
@@ -1156,7 +1505,7 @@ def render_http_errors_tab():
         if not server_ips_df.empty:
             total_server_requests = len(server_ips_df)
             unique_servers = server_ips_df['server_ip'].nunique()
-            top_servers = server_ips_df['server_ip'].value_counts()
+            top_servers = _top_counts(server_ips_df['server_ip'], 10)
             
             server_stats.extend([
                 html.H4("�️ Server IP Analysis", style={'color': '#2980b9'}),
@@ -1177,7 +1526,7 @@ def render_http_errors_tab():
         if not streaming_df.empty:
             total_streams = len(streaming_df)
             unique_streams = streaming_df['stream_name'].nunique()
-            top_streams = streaming_df['stream_name'].value_counts()
+            top_streams = _top_counts(streaming_df['stream_name'], 15)
             
             streaming_stats.extend([
                 html.H4("📺 Stream Analysis", style={'color': '#3498db'}),
@@ -1197,8 +1546,8 @@ def render_http_errors_tab():
         combined_stats = []
         if not error_streaming_df.empty:
             total_stream_errors = len(error_streaming_df)
-            error_streams = error_streaming_df['stream_name'].value_counts()
-            error_servers = error_streaming_df['server_ip'].value_counts() if 'server_ip' in error_streaming_df.columns else None
+            error_streams = _top_counts(error_streaming_df['stream_name'], 10)
+            error_servers = _top_counts(error_streaming_df['server_ip'], 10) if 'server_ip' in error_streaming_df.columns else None
             
             combined_stats.extend([
                 html.H4("⚠️ Stream Error Analysis", style={'color': '#f39c12'}),
@@ -1228,24 +1577,20 @@ def render_http_errors_tab():
         
         # Server:Stream combination analysis
         server_stream_stats = []
-        server_stream_df = current_data[(current_data.get('has_server_ip', False) == True) & (current_data.get('has_stream_info', False) == True)]
+        server_stream_df = current_data.loc[server_stream_mask, _present_columns(current_data, 'server_ip', 'stream_name')]
         if not server_stream_df.empty:
-            # Create server:stream combinations  
-            server_stream_df['server_stream'] = server_stream_df['server_ip'] + ':' + server_stream_df['stream_name']
-            top_combinations = server_stream_df['server_stream'].value_counts()
+            # Count server/stream pairs directly; no per-row string building or splitting
+            top_combinations = (server_stream_df.groupby(['server_ip', 'stream_name'], sort=False, observed=True).size()
+                                .sort_values(ascending=False, kind='stable'))
             
             server_stream_stats.extend([
                 html.H4("🔗 Server:Stream Combinations", style={'color': '#8e44ad'}),
                 html.P(f"Total Server:Stream Events: {len(server_stream_df):,}"),
-                html.P(f"Unique Combinations: {server_stream_df['server_stream'].nunique():,}"),
+                html.P(f"Unique Combinations: {len(top_combinations):,}"),
                 html.H5("Top Server:Stream Pairs:", style={'marginTop': '20px'}),
             ])
             
-            for combo, count in top_combinations.head(15).items():
-                if isinstance(combo, str) and ':' in combo:
-                    server_ip, stream_name = combo.split(':', 1)
-                else:
-                    server_ip, stream_name = str(combo), "unknown"
+            for (server_ip, stream_name), count in top_combinations.head(15).items():
                 percentage = (count / len(server_stream_df)) * 100
                 server_stream_stats.append(
                     html.P([
@@ -1263,7 +1608,7 @@ def render_http_errors_tab():
                 html.H4("📋 Sample Error Messages", style={'color': '#8e44ad', 'marginTop': '30px'}),
             ])
             
-            for i, (_, row) in enumerate(error_streaming_df.head(5).iterrows()):
+            for i, row in enumerate(error_streaming_df.head(5).to_dict('records')):
                 sample_errors.append(
                     html.Div([
                         html.P(f"Error {i+1}:", style={'fontWeight': 'bold', 'margin': '10px 0 5px 0'}),
@@ -1280,20 +1625,10 @@ def render_http_errors_tab():
                     ], style={'backgroundColor': '#f8f9fa', 'padding': '10px', 'borderRadius': '5px', 'marginBottom': '10px'})
                 )
         
-        # Combine all sections
-        content = []
-        if error_stats:
-            content.extend(error_stats)
-        if server_stats:
-            content.extend([html.Hr()] + server_stats)
-        if streaming_stats:
-            content.extend([html.Hr()] + streaming_stats)
-        if combined_stats:
-            content.extend([html.Hr()] + combined_stats)
-        if server_stream_stats:
-            content.extend([html.Hr()] + server_stream_stats)
-        if sample_errors:
-            content.extend(sample_errors)
+        # Combine all sections, a rule between each non-empty one
+        content = list(_interleave([error_stats, server_stats, streaming_stats, combined_stats,
+                                    server_stream_stats], html.Hr))
+        content.extend(sample_errors)
             
         if not content:
             content = [
@@ -1308,6 +1643,7 @@ def render_http_errors_tab():
         return html.Div(content, style={'padding': '20px'})
         
     except Exception as e:
+        _render_failures += 1
         print(f"HTTP errors tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading HTTP errors analysis: {str(e)}", 
@@ -1317,14 +1653,11 @@ def render_http_errors_tab():
 
 def render_streaming_tab():
     """Render the streaming analytics tab for Nimble Streamer specific metrics."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or current_data.empty:
-            return html.Div([
-                html.P("No data available for streaming analytics.", 
-                       style={'textAlign': 'center', 'color': '#7f8c8d', 'margin': '50px'})
-            ])
+            return NO_STREAMING_DATA
         
         charts = []
         
@@ -1336,14 +1669,10 @@ def render_streaming_tab():
                 avg_requests_per_session = len(current_data) / total_sessions if total_sessions > 0 else 0
                 
                 # Session distribution
-                session_counts = current_data['session_id'].value_counts()
+                session_counts = current_data['session_id'].value_counts(sort=False)
                 
-                fig_sessions = px.histogram(
-                    x=session_counts.values,
-                    title="Session Activity Distribution",
-                    labels={'x': 'Requests per Session', 'y': 'Number of Sessions'},
-                    nbins=30
-                )
+                fig_sessions = _histogram_figure(session_counts.to_numpy(), "Session Activity Distribution",
+                                                 'Requests per Session', 'Number of Sessions')
                 charts.append(dcc.Graph(figure=fig_sessions))
                 
                 # Session metrics
@@ -1365,27 +1694,25 @@ def render_streaming_tab():
                 ]))
                 
             except Exception as e:
+                _render_failures += 1
                 print(f"Session analysis error: {str(e)}")
         
         # Stream Analysis
         if 'stream_alias' in current_data.columns:
             try:
-                popular_streams = current_data['stream_alias'].value_counts().head(15)
+                popular_streams = _top_counts(current_data['stream_alias'], 15)
                 
                 if not popular_streams.empty:
-                    fig_streams = px.bar(
-                        x=popular_streams.values,
-                        y=[str(stream)[:30] + '...' if len(str(stream)) > 30 else str(stream) 
-                           for stream in popular_streams.index],
-                        orientation='h',
-                        title="Most Popular Streams",
-                        labels={'x': 'Request Count', 'y': 'Stream Alias'}
-                    )
-                    fig_streams.update_layout(height=500)
+                    fig_streams = go.Figure(go.Bar(x=popular_streams.to_numpy(),
+                                                   y=_bar_labels(popular_streams.index, 30),
+                                                   orientation='h'))
+                    fig_streams.update_layout(title="Most Popular Streams", xaxis_title="Request Count",
+                                              yaxis_title="Stream Alias", height=500, uirevision='streams')
                     charts.append(html.Hr())
                     charts.append(dcc.Graph(figure=fig_streams))
                     
             except Exception as e:
+                _render_failures += 1
                 print(f"Stream analysis error: {str(e)}")
         
         # Protocol Analysis
@@ -1403,18 +1730,18 @@ def render_streaming_tab():
                     charts.append(dcc.Graph(figure=fig_protocols))
                     
             except Exception as e:
+                _render_failures += 1
                 print(f"Protocol analysis error: {str(e)}")
         
         # Connection Events Analysis
         if 'status' in current_data.columns:
             try:
-                # Filter for streaming events
-                streaming_events = current_data[current_data['status'].str.contains(
-                    'connect|disconnect|play|publish', case=False, na=False)]
+                # Classify each distinct status once; every count below comes from these totals
+                status_counts = _observed_counts(current_data['status'])
+                statuses = status_counts.index
+                event_counts = status_counts[statuses.str.contains(STREAM_EVENT_PATTERN, na=False)]
                 
-                if not streaming_events.empty:
-                    event_counts = streaming_events['status'].value_counts()
-                    
+                if not event_counts.empty:
                     fig_events = px.bar(
                         x=event_counts.index,
                         y=event_counts.values,
@@ -1427,8 +1754,9 @@ def render_streaming_tab():
                     charts.append(dcc.Graph(figure=fig_events))
                     
                     # Play to Publish ratio
-                    play_events = len(streaming_events[streaming_events['status'].str.contains('play', case=False, na=False)])
-                    publish_events = len(streaming_events[streaming_events['status'].str.contains('publish', case=False, na=False)])
+                    event_statuses = event_counts.index.str.lower()
+                    play_events = int(event_counts[event_statuses.str.contains('play', regex=False)].sum())
+                    publish_events = int(event_counts[event_statuses.str.contains('publish', regex=False)].sum())
                     
                     if publish_events > 0:
                         play_publish_ratio = play_events / publish_events
@@ -1441,6 +1769,7 @@ def render_streaming_tab():
                         ], style={'padding': '20px', 'backgroundColor': '#f8f9fa', 'borderRadius': '10px'}))
                     
             except Exception as e:
+                _render_failures += 1
                 print(f"Events analysis error: {str(e)}")
         
         if not charts:
@@ -1450,6 +1779,7 @@ def render_streaming_tab():
         return html.Div(charts)
         
     except Exception as e:
+        _render_failures += 1
         print(f"Streaming tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading streaming analytics: {str(e)}", 
@@ -1457,50 +1787,145 @@ def render_streaming_tab():
                           'margin': '50px'})
         ])
 
+# Rows per data-table page; only the visible page is sent to the browser
+DATA_PAGE_SIZE = 25
+
+# One '{column} op value' clause of a DataTable filter query; ops may carry an
+# i (case-insensitive) or s (case-sensitive) prefix
+TABLE_FILTER_CLAUSE = re.compile(
+    r'^\s*\{(?P<column>[^}]+)\}\s+(?P<case>[is]?)'
+    r'(?P<op>(?:contains|datestartswith|ge|le|ne|eq|lt|gt)(?=\s|$)|>=|<=|!=|=|<|>)\s*(?P<value>.*?)\s*$',
+    re.IGNORECASE
+)
+TABLE_FILTER_WORDS = {'ge': '>=', 'le': '<=', 'lt': '<', 'gt': '>', 'ne': '!=', 'eq': '='}
+
+def _table_columns(data):
+    """Columns the data table can show as text."""
+    return [col for col in data.columns
+            if data[col].dtype == object
+            or isinstance(data[col].dtype, pd.CategoricalDtype)
+            or pd.api.types.is_numeric_dtype(data[col])
+            or pd.api.types.is_datetime64_any_dtype(data[col])]
+
+def _table_records(rows, columns):
+    """Table records with every value as text of at most 100 characters; missing values are blank."""
+    rows = rows[columns]
+    text = rows.astype(object).astype(str).where(rows.notna(), '')
+    return text.apply(lambda col: col.str.slice(0, 100)).to_dict('records')
+
+def _split_filter_part(filter_part):
+    """Split one filter clause into (column, operator, value, ignore_case); column is None if unparsable."""
+    match = TABLE_FILTER_CLAUSE.match(filter_part)
+    if match is None:
+        return None, None, None, False
+    operator = match.group('op').lower()
+    operator = TABLE_FILTER_WORDS.get(operator, operator)
+    value_part = match.group('value') or ''
+    if len(value_part) > 1 and value_part[0] == value_part[-1] and value_part[0] in ('"', "'", '`'):
+        value = value_part[1:-1].replace('\\' + value_part[0], value_part[0])
+    else:
+        try:
+            value = float(value_part)
+        except ValueError:
+            value = value_part
+    return match.group('column'), operator, value, match.group('case').lower() == 'i'
+
+def _filter_text(value):
+    """A filter value as the table displays it ('200', not '200.0')."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _filter_clause_mask(values, operator, value, ignore_case=False):
+    """Row mask for one filter clause, matching the text the table displays."""
+    text = _filter_text(value)
+    if ignore_case:
+        text = text.lower()
+    
+    if isinstance(values.dtype, pd.CategoricalDtype) and operator in ('contains', '='):
+        # Test each category once, then gather by code
+        labels = values.cat.categories.astype(str)
+        if ignore_case:
+            labels = labels.str.lower()
+        if operator == 'contains':
+            matching = values.cat.categories[labels.str.contains(text, regex=False)]
+        else:
+            matching = values.cat.categories[labels == text]
+        return _isin_mask(values, matching)
+    
+    present = values.notna().to_numpy(dtype=bool, na_value=False)
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values) \
+            and isinstance(value, float) and operator not in ('contains', 'datestartswith'):
+        left = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        right = value
+    else:
+        strings = values.astype(str)
+        if ignore_case:
+            strings = strings.str.lower()
+        if operator == 'contains':
+            return present & strings.str.contains(text, regex=False).to_numpy(dtype=bool)
+        if operator == 'datestartswith':
+            return present & strings.str.startswith(text).to_numpy(dtype=bool)
+        left = strings.to_numpy(dtype=object)
+        right = text
+    compare = {'>=': np.greater_equal, '<=': np.less_equal, '<': np.less, '>': np.greater,
+               '!=': np.not_equal, '=': np.equal}[operator]
+    return present & compare(left, right).astype(bool)
+
+def _table_view(data, sort_by, filter_query):
+    """Row positions of data after the table's filter and sort, cached per frame."""
+    key = (tuple((s['column_id'], s['direction']) for s in sort_by or []), filter_query or '')
+    entry = _table_view_cache.get(id(data))
+    if entry is None or entry[0] is not data:
+        _table_view_cache.clear()
+        entry = _table_view_cache[id(data)] = (data, {})
+    if key in entry[1]:
+        return entry[1][key]
+    
+    keep = np.ones(len(data), dtype=bool)
+    for filter_part in (filter_query or '').split(' && '):
+        col_name, operator, value, ignore_case = _split_filter_part(filter_part)
+        if col_name in data.columns:
+            keep &= _filter_clause_mask(data[col_name], operator, value, ignore_case)
+    positions = np.flatnonzero(keep)
+    
+    sort_columns = [s for s in sort_by or [] if s['column_id'] in data.columns]
+    if sort_columns:
+        # Only the sort keys are copied to find the order
+        names = list(dict.fromkeys(s['column_id'] for s in sort_columns))
+        keys = data[names].iloc[positions].reset_index(drop=True)
+        sort_args = dict(by=[s['column_id'] for s in sort_columns],
+                         ascending=[s['direction'] == 'asc' for s in sort_columns], kind='stable')
+        try:
+            order = keys.sort_values(**sort_args).index.to_numpy()
+        except TypeError:
+            # Mixed-type object columns cannot be compared; sort them as the text the table shows
+            mixed = [col for col in names if keys[col].dtype == object]
+            keys = keys.astype({col: str for col in mixed})
+            order = keys.sort_values(**sort_args).index.to_numpy()
+        positions = positions[order]
+    
+    entry[1][key] = positions
+    return positions
+
 def render_data_tab():
     """Render the data table tab."""
-    global current_data
+    global current_data, _render_failures
     
     try:
         if current_data is None or current_data.empty:
-            return html.Div([
-                html.P("No data available.", 
-                       style={'textAlign': 'center', 'color': '#7f8c8d', 'margin': '50px'})
-            ])
-        
-        # Display first 1000 rows for performance
-        display_data = current_data.head(1000)
+            return NO_TABLE_DATA
         
-        # Prepare columns - exclude problematic columns or handle them
-        columns = []
-        for col in display_data.columns:
-            try:
-                # Check if column has reasonable data types
-                if display_data[col].dtype in ['object', 'int64', 'float64', 'bool', 'datetime64[ns]']:
-                    columns.append({'name': col, 'id': col})
-            except Exception as e:
-                print(f"Column {col} skipped: {str(e)}")
-                continue
+        columns = [{'name': col, 'id': col} for col in _table_columns(current_data)]
         
         if not columns:
-            return html.Div([
-                html.P("No suitable columns found for display.", 
-                       style={'textAlign': 'center', 'color': '#7f8c8d', 'margin': '50px'})
-            ])
+            return NO_TABLE_COLUMNS
         
-        # Convert data to records, handling potential issues
+        # Only the first page is rendered here; update_data_table serves the rest
         try:
-            table_data = display_data[[col['id'] for col in columns]].fillna('').to_dict('records')
-            
-            # Convert all values to strings to avoid serialization issues
-            for record in table_data:
-                for key, value in record.items():
-                    if pd.isna(value) or value is None:
-                        record[key] = ''
-                    else:
-                        record[key] = str(value)[:100]  # Limit string length
-                        
+            table_data = _table_records(current_data.iloc[:DATA_PAGE_SIZE], [col['id'] for col in columns])
         except Exception as e:
+            _render_failures += 1
             print(f"Data preparation error: {str(e)}")
             return html.Div([
                 html.P(f"Error preparing data for display: {str(e)}", 
@@ -1508,12 +1933,15 @@ def render_data_tab():
             ])
         
         return html.Div([
-            html.H4(f"📋 Data Table (showing first 1,000 of {len(current_data):,} rows)"),
+            html.H4(f"📋 Data Table ({len(current_data):,} rows)"),
             html.Div([
                 dash_table.DataTable(
+                    id='data-table',
                     data=table_data,  # type: ignore
                     columns=columns,
-                    page_size=25,
+                    page_size=DATA_PAGE_SIZE,
+                    page_current=0,
+                    page_count=max(1, -(-len(current_data) // DATA_PAGE_SIZE)),
                     style_cell={
                         'textAlign': 'left', 
                         'overflow': 'hidden', 
@@ -1531,14 +1959,18 @@ def render_data_tab():
                         'height': 'auto',
                         'backgroundColor': '#f8f9fa'
                     },
-                    filter_action="native",
-                    sort_action="native",
-                    page_action="native"
+                    filter_action="custom",
+                    filter_query='',
+                    sort_action="custom",
+                    sort_mode="multi",
+                    sort_by=[],
+                    page_action="custom"
                 )
             ], style={'overflowX': 'auto'})
         ])
         
     except Exception as e:
+        _render_failures += 1
         print(f"Data tab error: {str(e)}")
         return html.Div([
             html.P(f"❌ Error loading data table: {str(e)}", 
@@ -1546,25 +1978,61 @@ def render_data_tab():
                           'margin': '50px'})
         ])
 
+@app.callback(
+    [Output('data-table', 'data'),
+     Output('data-table', 'page_count'),
+     Output('data-table', 'page_current')],
+    [Input('data-table', 'page_current'),
+     Input('data-table', 'page_size'),
+     Input('data-table', 'sort_by'),
+     Input('data-table', 'filter_query')],
+    prevent_initial_call=True
+)
+def update_data_table(page_current, page_size, sort_by, filter_query):
+    """Serve one page of the data table, filtered and sorted on the server."""
+    if current_data is None:
+        return [], 1, 0
+    
+    # A new filter or sort starts again from the first page
+    triggered = dash.callback_context.triggered_prop_ids
+    if 'data-table.filter_query' in triggered or 'data-table.sort_by' in triggered:
+        page_current = 0
+    
+    try:
+        page_size = page_size or DATA_PAGE_SIZE
+        positions = _table_view(current_data, sort_by, filter_query)
+        page_count = max(1, -(-len(positions) // page_size))
+        page_current = min(page_current or 0, page_count - 1)
+        start = page_current * page_size
+        rows = current_data.iloc[positions[start:start + page_size]]
+        return _table_records(rows, _table_columns(current_data)), page_count, page_current
+    except Exception as e:
+        print(f"Data table page error: {str(e)}")
+        return [], 1, 0
+
 def render_export_tab():
     """Render the export options tab."""
     reports_dir = "reports"
     
     if not os.path.exists(reports_dir):
-        return html.P("No reports directory found. Run analysis first.")
+        return NO_REPORTS_DIR
     
-    # List available files
-    report_files = []
-    if os.path.exists(reports_dir):
-        for file in os.listdir(reports_dir):
-            if file.endswith(('.csv', '.xlsx', '.png')):
-                file_path = os.path.join(reports_dir, file)
-                file_size = os.path.getsize(file_path)
-                report_files.append({
-                    'name': file,
-                    'size': f"{file_size / 1024:.1f} KB",
-                    'modified': datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d %H:%M:%S')
-                })
+    # List available files; one stat per entry covers both size and time
+    names, sizes, mtimes = [], [], []
+    with os.scandir(reports_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(('.csv', '.xlsx', '.png')):
+                stat = entry.stat()
+                names.append(entry.name)
+                sizes.append(stat.st_size)
+                mtimes.append(stat.st_mtime)
+    
+    # Format the size and time columns in one pass each
+    listing = pd.DataFrame({'name': names, 'size': np.array(sizes, dtype=np.int64), 'mtime': mtimes})
+    listing['size'] = (listing['size'] / 1024).round(1).astype(str) + ' KB'
+    listing['modified'] = (pd.to_datetime(listing['mtime'], unit='s', utc=True)
+                           .dt.tz_convert(tzlocal()).dt.strftime('%Y-%m-%d %H:%M:%S'))
+    report_files = listing[['name', 'size', 'modified']].to_dict('records')
     
     return html.Div([
         html.H4("📥 Export & Download Reports"),
@@ -1597,22 +2065,40 @@ def render_export_tab():
         ])
     ])
 
+def run_server(host, port):
+    """Serve the app with waitress when available, else Flask's built-in threaded server."""
+    if WAITRESS_AVAILABLE:
+        serve(app.server, host=host, port=port, threads=SERVER_THREADS)
+    else:
+        app.run(debug=False, host=host, port=port, dev_tools_ui=False, dev_tools_props_check=False,
+                use_reloader=False, threaded=True)
+
 def find_available_port(start_port=8050, max_attempts=10):
     """Find an available port starting from start_port"""
     import socket
     
+    # A bind test answers immediately; no connect attempt or timeout per port.
+    # SO_REUSEADDR is left off: on Windows it lets a bind succeed on a port in use.
     for port in range(start_port, start_port + max_attempts):
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(('127.0.0.1', port))
-            sock.close()
-            if result != 0:  # Port is available
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind(('127.0.0.1', port))
                 return port
-        except Exception:
-            continue
+            except OSError:
+                continue
     return None
 
+def _isin_mask(values, allowed):
+    """Row mask of values in allowed; categoricals index a per-category lookup table by code."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        positions = categories.get_indexer(pd.Index(allowed, dtype=object))
+        # One spare slot so the -1 code of missing values reads False
+        lookup = np.zeros(len(categories) + 1, dtype=bool)
+        lookup[positions[positions >= 0]] = True
+        return lookup[values.cat.codes.to_numpy()]
+    return values.isin(allowed).to_numpy(dtype=bool, na_value=False)
+
 # Apply Filters Callback
 @app.callback(
     Output('analysis-data', 'data', allow_duplicate=True),
@@ -1635,64 +2121,67 @@ def apply_filters(n_clicks, start_date, end_date, status_filter, protocol_filter
     try:
         print(f"Applying filters: start_date={start_date}, end_date={end_date}, status={status_filter}, protocol={protocol_filter}, stream={stream_filter}")
         
-        # Start with original data
-        filtered_data = current_data.copy()
+        # Each filter narrows one row mask; rows are copied once at the end
+        # instead of building a new frame after every filter
+        keep = np.ones(len(current_data), dtype=bool)
         
         # Apply date range filter
-        if start_date and end_date and 'timestamp' in filtered_data.columns:
+        if start_date and end_date and 'timestamp' in current_data.columns:
             try:
-                # Convert timestamp to datetime - use datetime column if available
-                if 'datetime' in filtered_data.columns and not filtered_data['datetime'].isna().all():
-                    filtered_data['timestamp_dt'] = pd.to_datetime(filtered_data['datetime'], errors='coerce')
-                else:
-                    filtered_data['timestamp_dt'] = pd.to_datetime(filtered_data['timestamp'], errors='coerce')
+                # Already datetime64 after analysis, so no per-click parsing or column scan
+                timestamps = _parsed_timestamps(current_data)
                 
                 # Convert filter dates to datetime
                 start_dt = pd.to_datetime(start_date)
                 end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)  # Include full end date
                 
                 # Apply date filter
-                date_mask = (filtered_data['timestamp_dt'] >= start_dt) & (filtered_data['timestamp_dt'] <= end_dt)
-                filtered_data = filtered_data[date_mask]
+                date_mask = (timestamps >= start_dt) & (timestamps <= end_dt)
+                keep &= date_mask.to_numpy(dtype=bool, na_value=False)
                 
-                print(f"Date filter applied: {len(filtered_data)} records remaining (from {start_date} to {end_date})")
+                print(f"Date filter applied: {keep.sum()} records remaining (from {start_date} to {end_date})")
                 
             except Exception as e:
                 print(f"Date filter error: {str(e)}")
         
         # Apply status code filter
-        if status_filter and 'status_code' in filtered_data.columns:
+        if status_filter and 'status_code' in current_data.columns:
             try:
-                status_mask = filtered_data['status_code'].isin(status_filter)
-                filtered_data = filtered_data[status_mask]
-                print(f"Status filter applied: {len(filtered_data)} records remaining")
+                keep &= _isin_mask(current_data['status_code'], status_filter)
+                print(f"Status filter applied: {keep.sum()} records remaining")
             except Exception as e:
                 print(f"Status filter error: {str(e)}")
         
         # Apply protocol filter
-        if protocol_filter and 'protocol' in filtered_data.columns:
+        if protocol_filter and 'protocol' in current_data.columns:
             try:
-                protocol_mask = filtered_data['protocol'].isin(protocol_filter)
-                filtered_data = filtered_data[protocol_mask]
-                print(f"Protocol filter applied: {len(filtered_data)} records remaining")
+                keep &= _isin_mask(current_data['protocol'], protocol_filter)
+                print(f"Protocol filter applied: {keep.sum()} records remaining")
             except Exception as e:
                 print(f"Protocol filter error: {str(e)}")
         
         # Apply stream filter
-        if stream_filter and 'stream_name' in filtered_data.columns:
+        if stream_filter and 'stream_name' in current_data.columns:
             try:
-                stream_mask = filtered_data['stream_name'].isin(stream_filter)
-                filtered_data = filtered_data[stream_mask]
-                print(f"Stream filter applied: {len(filtered_data)} records remaining")
+                keep &= _isin_mask(current_data['stream_name'], stream_filter)
+                print(f"Stream filter applied: {keep.sum()} records remaining")
             except Exception as e:
                 print(f"Stream filter error: {str(e)}")
         
+        filtered_data = current_data[keep]
+        
+        # Drop categories the filters emptied so value_counts() only reports what is left
+        categorical = filtered_data.select_dtypes('category').columns
+        if len(categorical):
+            filtered_data = filtered_data.assign(**{col: filtered_data[col].cat.remove_unused_categories()
+                                                    for col in categorical})
+        
         # Update global data with filtered results
         current_data = filtered_data
         
         # Prepare new analysis result
         total_entries = len(filtered_data)
-        parsed_entries = len(filtered_data[filtered_data['parsed'] == True]) if 'parsed' in filtered_data.columns else total_entries
+        parsed_entries = _parsed_count(filtered_data)
         
         # Create filtered analysis result
         filtered_analysis_result = {
@@ -1723,6 +2212,8 @@ def set_ipinfo_token_callback(n_clicks, token):
         if token and token.strip():
             try:
                 set_enhanced_ipinfo_token(token.strip())
+                _tab_cache.clear()  # IP tab lookups may resolve differently now
+                _ip_lookup_cache.clear()
                 stats = enhanced_ipinfo_service.get_statistics()
                 databases_status = "🗄️ Offline databases: " + (
                     "Country ✅" if stats['databases_loaded']['country'] else "Country ❌"
@@ -1776,7 +2267,7 @@ if __name__ == '__main__':
         print("🔥 Starting server... (Press Ctrl+C to stop)")
         print("=" * 50)
         
-        app.run(debug=False, host='127.0.0.1', port=port, dev_tools_ui=False, dev_tools_props_check=False, use_reloader=False, threaded=True)
+        run_server('127.0.0.1', port)
         
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
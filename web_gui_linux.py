@@ -7,12 +7,14 @@ Modified for Oracle Linux 10 deployment with external access support
 import os
 import sys
 import socket
+from functools import lru_cache
 from pathlib import Path
 
 # Add current directory to Python path
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
+@lru_cache(maxsize=1)
 def get_vm_ip():
     """Get the VM's IP address for external access."""
     try:
@@ -61,7 +63,7 @@ def main():
     
     # Import and configure the web application
     try:
-        from web_gui import app
+        from web_gui import run_server
         
         print("🚀 Starting Nimble Streamer Log Analyzer...")
         print("📍 Access URLs:")
@@ -73,14 +75,7 @@ def main():
         print()
         
         # Start the server with external access
-        app.run(
-            host='0.0.0.0',  # Accept connections from any IP
-            port=port,
-            debug=False,
-            dev_tools_ui=False,
-            dev_tools_props_check=False,
-            use_reloader=False
-        )
+        run_server('0.0.0.0', port)  # Accept connections from any IP
         
     except ImportError as e:
         print(f"❌ Import error: {e}")